@@ -8,7 +8,6 @@ No local file handling - Pure GCS integration
 import streamlit as st
 import os
 import json
-import time
 import threading
 import subprocess
 import sys
@@ -18,9 +17,21 @@ import logging
 from io import StringIO
 import queue
 import tempfile
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import islice
+from operator import itemgetter
+
+# GCS SDK is imported once per process; a missing package surfaces as an auth failure
+try:
+    from google.cloud import storage
+except ImportError:
+    storage = None
 
 # Import the extraction runner
 from streamlit_extractor_runner import ExtractionRunner
+from gcs_config import CONFIG_FILE
 
 # Configure page
 st.set_page_config(
@@ -30,8 +41,12 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Static HTML blocks - plain module constants, so reruns only re-send them.
+# (st.cache_data would pickle and copy the string on every hit, which costs
+# more than the lookup it saves.)
+STATIC_HTML = {
+    # Custom CSS for better styling
+    "css": """
 <style>
     .main-header {
         background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
@@ -70,6 +85,16 @@ st.markdown("""
         box-shadow: 0 2px 4px rgba(0,0,0,0.1);
         margin: 0.5rem 0;
     }
+    .metric-row {
+        display: flex;
+        gap: 1rem;
+    }
+    .metric-row .metric-card {
+        flex: 1;
+    }
+    .metric-row .metric-card h3 {
+        margin: 0;
+    }
     .stMetric {
         background: #f8f9fa;
         padding: 0.5rem;
@@ -77,21 +102,151 @@ st.markdown("""
         border-left: 4px solid #667eea;
     }
 </style>
-""", unsafe_allow_html=True)
+""",
+    "header": """
+<div class="main-header">
+    <h1 style="color: white; margin: 0;">🔍 Product Extractor Pro</h1>
+    <p style="color: #f0f0f0; margin: 0;">Cloud-First Product Extraction - Google Cloud Storage Only</p>
+</div>
+""",
+    "footer": """
+<div style="text-align: center; color: #666; padding: 1rem;">
+    🔍 Product Extractor Pro | Cloud-First Architecture | Google Cloud Storage Only<br/>
+    <small>Built with Streamlit & LangGraph | No local file storage</small>
+</div>
+"""
+}
+
+# Re-emitted every full rerun - Streamlit drops elements that are not re-sent
+st.markdown(STATIC_HTML["css"], unsafe_allow_html=True)
+
+# GCS handles - built once per process and reused across reruns
+@st.cache_resource
+def get_gcs_client():
+    """Return a shared, authenticated GCS client"""
+    if storage is None:
+        raise ImportError("google-cloud-storage is not installed")
+    return storage.Client()
+
+@st.cache_resource
+def get_bucket(name):
+    """Return a shared bucket handle for the given bucket name"""
+    return get_gcs_client().bucket(name)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def check_gcs_status(name):
+    """Return (status, error) for the bucket, caching failures too so reruns don't
+    repeat the slow credential discovery"""
+    try:
+        if get_bucket(name).exists():
+            return "connected", None
+        return "bucket_not_found", None
+    except Exception as e:
+        return "auth_failed", str(e)
+
+# Only request the blob metadata the UI reads
+BLOB_FIELDS = "items(name,size,updated,contentType),nextPageToken"
+# Same fields plus the folder names returned by delimiter listings
+FOLDER_LISTING_FIELDS = "items(name,size,updated,contentType),prefixes,nextPageToken"
+# Below this many product folders a single listing call is faster than fanning out
+PARALLEL_LISTING_MIN_PREFIXES = 8
+# Only the most recently created folders are listed, so calls stay bounded as products accumulate
+LISTED_FOLDER_LIMIT = 16
+LISTING_WORKERS = 8
+# Logs kept in session state - only the newest few are ever displayed
+MAX_LOG_ENTRIES = 500
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+
+def _blob_rows(blobs):
+    """Convert Blob objects into plain metadata dicts (cache-safe, unlike Blob objects)"""
+    return [
+        {
+            'name': blob.name,
+            'size': blob.size,
+            'updated': blob.updated,
+            'content_type': blob.content_type
+        }
+        for blob in blobs
+    ]
+
+def _newest_first(rows):
+    """Sort metadata rows by update time, newest first (rows without a timestamp last)"""
+    dated = [row for row in rows if row['updated'] is not None]
+    dated.sort(key=itemgetter('updated'), reverse=True)
+    return dated + [row for row in rows if row['updated'] is None]
+
+# Rows per page in the All Files view
+ALL_FILES_PAGE_SIZE = 50
+
+@st.cache_data(ttl=15, show_spinner=False)
+def list_blob_page(name, page_token=None, page_size=ALL_FILES_PAGE_SIZE):
+    """Fetch one page of the bucket listing; returns (rows, next_page_token)"""
+    iterator = get_bucket(name).list_blobs(max_results=page_size, page_token=page_token, fields=BLOB_FIELDS)
+    page = next(iterator.pages, [])
+    return _blob_rows(page), iterator.next_page_token
+
+@st.cache_data(ttl=15, show_spinner=False)
+def list_blobs(name, data_folder="data", max_results=100):
+    """List up to max_results bucket objects newest first, fanning out across the newest folders for large buckets"""
+    bucket = get_bucket(name)
+    
+    # One call covers small buckets; its page is also the answer when there is little to fan out over
+    first = bucket.list_blobs(max_results=max_results, fields=BLOB_FIELDS)
+    first_rows = _blob_rows(next(first.pages, []))
+    if not first.next_page_token:
+        return _newest_first(first_rows)
+    
+    # Top-level objects (reports, summaries) and folders, then the same one level into the data folder.
+    # Folder marker objects come back as rows too, which dates each folder.
+    top = bucket.list_blobs(delimiter="/", include_trailing_delimiter=True, fields=FOLDER_LISTING_FIELDS)
+    rows = _blob_rows(top)
+    prefixes = set(top.prefixes)
+    data_prefix = f"{data_folder}/"
+    if data_prefix in prefixes:
+        prefixes.discard(data_prefix)
+        folders = bucket.list_blobs(prefix=data_prefix, delimiter="/", include_trailing_delimiter=True, fields=FOLDER_LISTING_FIELDS)
+        rows.extend(_blob_rows(folders))
+        prefixes.update(folders.prefixes)
+    
+    if len(prefixes) < PARALLEL_LISTING_MIN_PREFIXES:
+        return _newest_first(first_rows)
+    
+    # Newest folders by marker time (unmarked folders last); markers are listed again with their folder
+    created = {row['name']: row['updated'] for row in rows if row['name'].endswith('/')}
+    newest = _newest_first([{'name': prefix, 'updated': created.get(prefix)} for prefix in prefixes])
+    rows = [row for row in rows if not row['name'].endswith('/')]
+    
+    def list_prefix(prefix):
+        return _blob_rows(bucket.list_blobs(prefix=prefix, max_results=max_results, fields=BLOB_FIELDS))
+    
+    with ThreadPoolExecutor(max_workers=LISTING_WORKERS) as executor:
+        for page in executor.map(list_prefix, [folder['name'] for folder in newest[:LISTED_FOLDER_LIMIT]]):
+            rows.extend(page)
+    return _newest_first(rows)[:max_results]
+
+def gcs_details_url(bucket_name, blob_name):
+    """Return the Cloud Console details page for an object"""
+    return f"https://console.cloud.google.com/storage/browser/_details/{bucket_name}/{blob_name}"
+
+def render_blob_table(rows, link_label):
+    """Render file rows as a single table with a console link column"""
+    st.dataframe(
+        pd.DataFrame(rows),
+        use_container_width=True,
+        hide_index=True,
+        column_config={"Link": st.column_config.LinkColumn(link_label, display_text=link_label)}
+    )
 
 # Initialize session state
 if 'extractor_runner' not in st.session_state:
     st.session_state.extractor_runner = ExtractionRunner()
+    # Initial stats; later refreshes happen on the runner's poll thread
+    st.session_state.extractor_runner.update_stats_from_files()
 if 'extraction_logs' not in st.session_state:
-    st.session_state.extraction_logs = []
+    st.session_state.extraction_logs = deque(maxlen=MAX_LOG_ENTRIES)
 
 # Header
-st.markdown("""
-<div class="main-header">
-    <h1 style="color: white; margin: 0;">🔍 Product Extractor Pro</h1>
-    <p style="color: #f0f0f0; margin: 0;">Cloud-First Product Extraction - Google Cloud Storage Only</p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(STATIC_HTML["header"], unsafe_allow_html=True)
 
 # Sidebar Configuration
 st.sidebar.header("⚙️ Configuration")
@@ -112,20 +267,14 @@ data_folder = st.sidebar.text_input(
 
 # GCS Authentication Status
 st.sidebar.subheader("🔐 Authentication Status")
-try:
-    from google.cloud import storage
-    client = storage.Client()
-    bucket = client.bucket(bucket_name)
-    if bucket.exists():
-        st.sidebar.markdown('<div class="status-success">✅ GCS Connected</div>', unsafe_allow_html=True)
-        gcs_status = "connected"
-    else:
-        st.sidebar.markdown('<div class="status-error">❌ Bucket not found</div>', unsafe_allow_html=True)
-        gcs_status = "bucket_not_found"
-except Exception as e:
+gcs_status, gcs_error = check_gcs_status(bucket_name)
+if gcs_status == "connected":
+    st.sidebar.markdown('<div class="status-success">✅ GCS Connected</div>', unsafe_allow_html=True)
+elif gcs_status == "bucket_not_found":
+    st.sidebar.markdown('<div class="status-error">❌ Bucket not found</div>', unsafe_allow_html=True)
+else:
     st.sidebar.markdown('<div class="status-error">❌ Authentication Failed</div>', unsafe_allow_html=True)
-    st.sidebar.error(f"Error: {str(e)[:100]}...")
-    gcs_status = "auth_failed"
+    st.sidebar.error(f"Error: {gcs_error[:100]}...")
 
 # Cloud-first notice
 st.sidebar.info("🌩️ **Cloud-First Architecture**: All data saved directly to Google Cloud Storage. No local files created.")
@@ -144,60 +293,59 @@ st.sidebar.subheader("🔬 Advanced Options")
 download_images = st.sidebar.checkbox("Download Product Images", value=True)
 st.sidebar.info("📁 All data automatically saved to GCS (JSON, Excel, Images)")
 
-# Function to update GCS config
-def update_gcs_config():
-    """Update the GCS configuration file for cloud-first mode"""
-    config_content = f'''#!/usr/bin/env python3
-"""
-Google Cloud Storage Configuration
-Updated via Streamlit UI - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Cloud-First Architecture: Google Cloud Storage Only
-"""
-
-# GCS Configuration - Always enabled for cloud-first mode
-USE_GCS = True
-GCS_BUCKET_NAME = "{bucket_name}"
-GCS_DATA_FOLDER = "{data_folder}"
-
-# Extraction Configuration
-EXTRACTION_CONFIG = {{
-    "headless_mode": {headless_mode},
-    "delay_between_products": {delay_between_products},
-    "max_parallel_extractions": {max_parallel_extractions},
-    "max_retries": {max_retries},
-    "confidence_threshold": {confidence_threshold},
-    "cloud_first_mode": True
-}}
-
-def validate_gcs_config():
-    """Validate GCS configuration"""
-    if USE_GCS:
-        if GCS_BUCKET_NAME == "your-bucket-name":
-            print("Please update GCS_BUCKET_NAME in gcs_config.py with your actual bucket name")
-            return False
-        
-        try:
-            from google.cloud import storage
-            client = storage.Client()
-            bucket = client.bucket(GCS_BUCKET_NAME)
-            if not bucket.exists():
-                print(f"GCS bucket '{{GCS_BUCKET_NAME}}' does not exist!")
-                print("Please create the bucket or update GCS_BUCKET_NAME.")
+def write_if_changed(path, content):
+    """Atomically write content to path, skipping the write when it is unchanged"""
+    data = content.encode('utf-8')
+    new_hash = hashlib.blake2b(data, digest_size=16).digest()
+    try:
+        with open(path, 'rb') as f:
+            if hashlib.blake2b(f.read(), digest_size=16).digest() == new_hash:
                 return False
-            print(f"GCS bucket '{{GCS_BUCKET_NAME}}' is accessible")
-            return True
-        except Exception as e:
-            print(f"GCS validation failed: {{e}}")
-            return False
+    except FileNotFoundError:
+        pass
+    
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
     return True
 
-def print_setup_instructions():
-    """Print GCS setup instructions"""
-    pass
-'''
+# Function to update GCS config
+def update_gcs_config():
+    """Update gcs_config.json for cloud-first mode (read at run time via gcs_config.load_gcs_config)"""
+    config = {
+        # GCS Configuration - Always enabled for cloud-first mode
+        "USE_GCS": True,
+        "GCS_BUCKET_NAME": bucket_name,
+        "GCS_DATA_FOLDER": data_folder,
+        # Extraction Configuration
+        "EXTRACTION_CONFIG": {
+            "headless_mode": headless_mode,
+            "delay_between_products": delay_between_products,
+            "max_parallel_extractions": max_parallel_extractions,
+            "max_retries": max_retries,
+            "confidence_threshold": confidence_threshold,
+            "cloud_first_mode": True
+        }
+    }
     
-    with open('gcs_config.py', 'w', encoding='utf-8') as f:
-        f.write(config_content)
+    # No timestamp in the config itself, so unchanged settings skip the write;
+    # audit info goes to a sidecar file that no consumer reads
+    if write_if_changed(CONFIG_FILE, json.dumps(config, indent=4)):
+        meta_file = os.path.splitext(CONFIG_FILE)[0] + '.meta.json'
+        try:
+            with open(meta_file, 'r', encoding='utf-8') as f:
+                revision = json.load(f).get('revision', 0) + 1
+        except (FileNotFoundError, json.JSONDecodeError):
+            revision = 1
+        write_if_changed(meta_file, json.dumps({
+            'revision': revision,
+            'updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }, indent=4))
 
 # Main content area
 col1, col2 = st.columns([2, 1])
@@ -209,12 +357,6 @@ with col1:
     runner = st.session_state.extractor_runner
     is_running = runner.is_running
     
-    # Status display
-    if is_running:
-        st.markdown(f'<div class="status-warning">⏳ {runner.stats["current_status"]}</div>', unsafe_allow_html=True)
-    else:
-        st.markdown('<div class="status-success">✅ Ready to start cloud extraction</div>', unsafe_allow_html=True)
-    
     # Control buttons
     col_start, col_stop, col_clear = st.columns(3)
     
@@ -225,11 +367,12 @@ with col1:
             else:
                 # Update configuration
                 update_gcs_config()
+                list_blobs.clear()
                 st.success("✅ Starting cloud extraction...")
                 
                 # Start the extraction
                 if runner.start_extraction():
-                    st.session_state.extraction_logs = []
+                    st.session_state.extraction_logs.clear()
                     st.rerun()
                 else:
                     st.error("❌ Failed to start extraction")
@@ -237,13 +380,14 @@ with col1:
     with col_stop:
         if st.button("⏹️ Stop Extraction", disabled=not is_running):
             runner.stop_extraction()
+            list_blobs.clear()
             st.warning("⏹️ Extraction stopped")
             st.rerun()
     
     with col_clear:
+        # No st.rerun() needed - the log panel renders later in this same run
         if st.button("🗑️ Clear Logs"):
-            st.session_state.extraction_logs = []
-            st.rerun()
+            st.session_state.extraction_logs.clear()
 
 with col2:
     st.header("📊 Quick Stats")
@@ -263,183 +407,223 @@ with col2:
     </div>
     """, unsafe_allow_html=True)
 
-# Progress tracking with real data
-st.header("📈 Extraction Progress")
+# Live panel - reruns on its own timer while extraction is running, leaving
+# the sidebar and header untouched
+@st.fragment(run_every=3 if is_running else None)
+def live_panel():
+    # Status display - inside the fragment so the current status follows the run
+    if runner.is_running:
+        st.markdown(f'<div class="status-warning">⏳ {runner.stats["current_status"]}</div>', unsafe_allow_html=True)
+    else:
+        st.markdown('<div class="status-success">✅ Ready to start cloud extraction</div>', unsafe_allow_html=True)
+    
+    # Progress tracking with real data
+    st.header("📈 Extraction Progress")
 
-# Update stats and get new logs
-runner.update_stats_from_files()
-new_logs = runner.get_logs()
-st.session_state.extraction_logs.extend(new_logs)
+    # Collect new logs (stats are refreshed by the runner's background poll thread)
+    new_logs = runner.get_logs()
+    st.session_state.extraction_logs.extend(new_logs)
 
-# Display metrics
-col1, col2, col3, col4 = st.columns(4)
-with col1:
-    st.metric("Products Found", runner.stats['products_found'])
-with col2:
-    st.metric("Successfully Extracted", runner.stats['successful_extractions'])
-with col3:
-    st.metric("Failed Extractions", runner.stats['failed_extractions'])
-with col4:
-    st.metric("Success Rate", f"{runner.stats['success_rate']:.1f}%")
-
-# Progress bar
-if runner.stats['products_found'] > 0:
-    progress = runner.stats['successful_extractions'] / runner.stats['products_found']
-    st.progress(progress, f"Progress: {progress*100:.1f}%")
-
-# Real-time logs section
-st.header("📝 Real-time Logs")
-
-log_container = st.container()
-with log_container:
-    if st.session_state.extraction_logs:
-        # Display logs in reverse order (newest first)
-        for log_entry in reversed(st.session_state.extraction_logs[-20:]):  # Show last 20 logs
-            timestamp = log_entry.get('timestamp', '')
-            level = log_entry.get('level', 'INFO')
-            message = log_entry.get('message', '')
+    # Display metrics - one HTML element instead of four st.metric widgets per refresh
+    st.markdown(f"""
+    <div class="metric-row">
+        <div class="metric-card">Products Found<h3>{runner.stats['products_found']}</h3></div>
+        <div class="metric-card">Successfully Extracted<h3>{runner.stats['successful_extractions']}</h3></div>
+        <div class="metric-card">Failed Extractions<h3>{runner.stats['failed_extractions']}</h3></div>
+        <div class="metric-card">Success Rate<h3>{runner.stats['success_rate']:.1f}%</h3></div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Progress bar
+    if runner.stats['products_found'] > 0:
+        progress = runner.stats['successful_extractions'] / runner.stats['products_found']
+        st.progress(progress, f"Progress: {progress*100:.1f}%")
+
+    # Real-time logs section
+    st.header("📝 Real-time Logs")
+
+    log_container = st.container()
+    with log_container:
+        if st.session_state.extraction_logs:
+            # Display logs in reverse order (newest first)
+            for log_entry in islice(reversed(st.session_state.extraction_logs), 20):  # Show last 20 logs
+                timestamp = log_entry.get('timestamp', '')
+                level = log_entry.get('level', 'INFO')
+                message = log_entry.get('message', '')
             
-            if level == 'ERROR':
-                st.error(f"[{timestamp}] {message}")
-            elif level == 'WARNING':
-                st.warning(f"[{timestamp}] {message}")
-            else:
-                st.info(f"[{timestamp}] {message}")
-    else:
-        st.info("No logs yet. Start an extraction to see real-time progress.")
+                if level == 'ERROR':
+                    st.error(f"[{timestamp}] {message}")
+                elif level == 'WARNING':
+                    st.warning(f"[{timestamp}] {message}")
+                else:
+                    st.info(f"[{timestamp}] {message}")
+        else:
+            st.info("No logs yet. Start an extraction to see real-time progress.")
 
-# Results section - GCS Only
-st.header("☁️ Cloud Storage Results")
+    # Extraction finished inside the fragment - rerun the app so controls refresh
+    if is_running and not runner.is_running:
+        st.rerun()
 
-if gcs_status == "connected":
-    st.subheader("🗂️ GCS Bucket Browser")
-    try:
-        from google.cloud import storage
-        client = storage.Client()
-        bucket = client.bucket(bucket_name)
-        
-        blobs = list(bucket.list_blobs(max_results=100))
-        if blobs:
-            # Filter and organize blobs
-            excel_blobs = [b for b in blobs if b.name.endswith('.xlsx')]
-            json_blobs = [b for b in blobs if b.name.endswith('.json') and not b.name.endswith('product_details.json')]
-            image_blobs = [b for b in blobs if b.name.endswith(('.jpg', '.jpeg', '.png', '.gif', '.webp'))]
-            product_json_blobs = [b for b in blobs if b.name.endswith('product_details.json')]
+live_panel()
+
+# Results browser - its own fragment so it refreshes on the (slower) bucket
+# listing cadence rather than with every live panel tick
+@st.fragment(run_every=15 if is_running else None)
+def results_panel(bucket_name, data_folder, gcs_status):
+    # Results section - GCS Only
+    st.header("☁️ Cloud Storage Results")
+
+    if gcs_status == "connected":
+        st.subheader("🗂️ GCS Bucket Browser")
+        try:
+            blobs = list_blobs(bucket_name, data_folder)
+            if blobs:
+                # Filter and organize blobs
+                excel_blobs, json_blobs, image_blobs, product_json_blobs = [], [], [], []
+                for b in blobs:
+                    blob_name = b['name']
+                    ext = os.path.splitext(blob_name)[1]
+                    if ext == '.xlsx':
+                        excel_blobs.append(b)
+                    elif blob_name.endswith('product_details.json'):
+                        product_json_blobs.append(b)
+                    elif ext == '.json':
+                        json_blobs.append(b)
+                    elif ext in IMAGE_EXTENSIONS:
+                        image_blobs.append(b)
             
-            # Create tabs for different file types
-            tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Excel Reports", "📋 Summaries", "🖼️ Images", "📄 Product JSONs", "📁 All Files"])
+                # View selector for different file types - unlike st.tabs, only the
+                # selected view is built on each rerun
+                view = st.radio(
+                    "View",
+                    ["📊 Excel Reports", "📋 Summaries", "🖼️ Images", "📄 Product JSONs", "📁 All Files"],
+                    horizontal=True,
+                    key="results_tab",
+                    label_visibility="collapsed"
+                )
             
-            with tab1:
-                if excel_blobs:
-                    st.write("**Excel Extraction Results**")
-                    for blob in sorted(excel_blobs, key=lambda x: x.updated, reverse=True)[:10]:
-                        col1, col2, col3 = st.columns([3, 2, 2])
-                        with col1:
-                            st.text(f"📄 {blob.name}")
-                        with col2:
-                            st.text(f"🕒 {blob.updated.strftime('%Y-%m-%d %H:%M:%S')}")
-                            st.text(f"📏 {blob.size / 1024:.1f} KB")
-                        with col3:
-                            st.link_button("View in GCS", f"https://console.cloud.google.com/storage/browser/_details/{bucket_name}/{blob.name}")
-                else:
-                    st.info("No Excel files found yet. Start an extraction to generate reports.")
+                if view == "📊 Excel Reports":
+                    if excel_blobs:
+                        st.write("**Excel Extraction Results**")
+                        render_blob_table([
+                            {
+                                'File': f"📄 {blob['name']}",
+                                'Updated': blob['updated'].strftime('%Y-%m-%d %H:%M:%S'),
+                                'Size': f"{blob['size'] / 1024:.1f} KB",
+                                'Link': gcs_details_url(bucket_name, blob['name'])
+                            }
+                            for blob in excel_blobs[:10]
+                        ], "View in GCS")
+                    else:
+                        st.info("No Excel files found yet. Start an extraction to generate reports.")
             
-            with tab2:
-                if json_blobs:
-                    st.write("**Extraction Summary Reports**")
-                    for blob in sorted(json_blobs, key=lambda x: x.updated, reverse=True)[:5]:
-                        col1, col2, col3 = st.columns([3, 2, 2])
-                        with col1:
-                            st.text(f"📋 {blob.name}")
-                        with col2:
-                            st.text(f"🕒 {blob.updated.strftime('%Y-%m-%d %H:%M:%S')}")
-                        with col3:
-                            st.link_button("View in GCS", f"https://console.cloud.google.com/storage/browser/_details/{bucket_name}/{blob.name}")
-                else:
-                    st.info("No summary files found yet.")
+                elif view == "📋 Summaries":
+                    if json_blobs:
+                        st.write("**Extraction Summary Reports**")
+                        render_blob_table([
+                            {
+                                'File': f"📋 {blob['name']}",
+                                'Updated': blob['updated'].strftime('%Y-%m-%d %H:%M:%S'),
+                                'Link': gcs_details_url(bucket_name, blob['name'])
+                            }
+                            for blob in json_blobs[:5]
+                        ], "View in GCS")
+                    else:
+                        st.info("No summary files found yet.")
             
-            with tab3:
-                if image_blobs:
-                    st.write("**Product Images**")
-                    for blob in sorted(image_blobs, key=lambda x: x.updated, reverse=True)[:20]:
-                        col1, col2, col3 = st.columns([3, 2, 2])
-                        with col1:
-                            st.text(f"🖼️ {blob.name}")
-                        with col2:
-                            st.text(f"📏 {blob.size / 1024:.1f} KB")
-                        with col3:
-                            st.link_button("View Image", f"https://console.cloud.google.com/storage/browser/_details/{bucket_name}/{blob.name}")
-                else:
-                    st.info("No images found yet.")
+                elif view == "🖼️ Images":
+                    if image_blobs:
+                        st.write("**Product Images**")
+                        render_blob_table([
+                            {
+                                'File': f"🖼️ {blob['name']}",
+                                'Size': f"{blob['size'] / 1024:.1f} KB",
+                                'Link': gcs_details_url(bucket_name, blob['name'])
+                            }
+                            for blob in image_blobs[:20]
+                        ], "View Image")
+                    else:
+                        st.info("No images found yet.")
             
-            with tab4:
-                if product_json_blobs:
-                    st.write("**Individual Product Data**")
-                    for blob in sorted(product_json_blobs, key=lambda x: x.updated, reverse=True)[:20]:
-                        col1, col2, col3 = st.columns([3, 2, 2])
-                        with col1:
-                            product_folder = '/'.join(blob.name.split('/')[:-1])
-                            st.text(f"📄 {product_folder}")
-                        with col2:
-                            st.text(f"🕒 {blob.updated.strftime('%Y-%m-%d %H:%M:%S')}")
-                        with col3:
-                            st.link_button("View JSON", f"https://console.cloud.google.com/storage/browser/_details/{bucket_name}/{blob.name}")
-                else:
-                    st.info("No product JSON files found yet.")
+                elif view == "📄 Product JSONs":
+                    if product_json_blobs:
+                        st.write("**Individual Product Data**")
+                        render_blob_table([
+                            {
+                                'Product': f"📄 {blob['name'].rpartition('/')[0]}",
+                                'Updated': blob['updated'].strftime('%Y-%m-%d %H:%M:%S'),
+                                'Link': gcs_details_url(bucket_name, blob['name'])
+                            }
+                            for blob in product_json_blobs[:20]
+                        ], "View JSON")
+                    else:
+                        st.info("No product JSON files found yet.")
             
-            with tab5:
-                st.write("**Complete Bucket Contents**")
-                df_blobs = pd.DataFrame([
-                    {
-                        'Name': blob.name,
-                        'Size': f"{blob.size / 1024:.1f} KB" if blob.size else "0 KB",
-                        'Updated': blob.updated.strftime('%Y-%m-%d %H:%M:%S') if blob.updated else 'Unknown',
-                        'Type': blob.content_type or 'Unknown'
-                    }
-                    for blob in sorted(blobs, key=lambda x: x.updated or datetime.min, reverse=True)
-                ])
-                st.dataframe(df_blobs, use_container_width=True)
+                else:
+                    st.write("**Complete Bucket Contents**")
+                    
+                    # Page tokens visited so far; the last one is the current page
+                    if st.session_state.get('all_files_bucket') != bucket_name:
+                        st.session_state.all_files_bucket = bucket_name
+                        st.session_state.all_files_tokens = [None]
+                    page_tokens = st.session_state.all_files_tokens
+                    page_rows, next_token = list_blob_page(bucket_name, page_tokens[-1])
+                    st.caption(f"Pages follow GCS name order, {ALL_FILES_PAGE_SIZE} files each; each page is sorted newest first")
+                    
+                    records = pd.DataFrame.from_records(_newest_first(page_rows), columns=['name', 'size', 'updated', 'content_type'])
+                    records['updated'] = pd.to_datetime(records['updated'], utc=True)
+                    sizes = pd.to_numeric(records['size']).fillna(0)
+                    df_blobs = pd.DataFrame({
+                        'Name': records['name'],
+                        'Size': ((sizes / 1024).round(1).astype(str) + ' KB').where(sizes > 0, '0 KB'),
+                        'Updated': records['updated'].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('Unknown'),
+                        'Type': records['content_type'].fillna('').replace('', 'Unknown')
+                    }).reset_index(drop=True)
+                    st.dataframe(df_blobs, use_container_width=True)
+                    
+                    col_prev, col_page, col_next = st.columns([1, 2, 1])
+                    with col_prev:
+                        if st.button("⬅️ Previous", disabled=len(page_tokens) == 1, key="all_files_prev"):
+                            page_tokens.pop()
+                            st.rerun(scope="fragment")
+                    with col_page:
+                        st.caption(f"Page {len(page_tokens)}")
+                    with col_next:
+                        if st.button("Next ➡️", disabled=next_token is None, key="all_files_next"):
+                            page_tokens.append(next_token)
+                            st.rerun(scope="fragment")
                 
-                # Bucket statistics
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Total Files", len(blobs))
-                with col2:
-                    st.metric("Excel Reports", len(excel_blobs))
-                with col3:
-                    st.metric("Product Images", len(image_blobs))
-                with col4:
-                    st.metric("Product JSONs", len(product_json_blobs))
-        else:
-            st.info("🌟 Bucket is empty. Start an extraction to see results here!")
+                    # Bucket statistics
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        st.metric("Total Files", len(blobs))
+                    with col2:
+                        st.metric("Excel Reports", len(excel_blobs))
+                    with col3:
+                        st.metric("Product Images", len(image_blobs))
+                    with col4:
+                        st.metric("Product JSONs", len(product_json_blobs))
+            else:
+                st.info("🌟 Bucket is empty. Start an extraction to see results here!")
             
-        # Direct GCS links
-        st.markdown("---")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.link_button("🌐 Open GCS Console", f"https://console.cloud.google.com/storage/browser/{bucket_name}")
-        with col2:
-            st.link_button("📊 Cloud Storage Dashboard", "https://console.cloud.google.com/storage/")
+            # Direct GCS links
+            st.markdown("---")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.link_button("🌐 Open GCS Console", f"https://console.cloud.google.com/storage/browser/{bucket_name}")
+            with col2:
+                st.link_button("📊 Cloud Storage Dashboard", "https://console.cloud.google.com/storage/")
             
-    except Exception as e:
-        st.error(f"❌ Error accessing GCS bucket: {e}")
-        st.info("Please check your authentication and bucket configuration.")
+        except Exception as e:
+            st.error(f"❌ Error accessing GCS bucket: {e}")
+            st.info("Please check your authentication and bucket configuration.")
 
-else:
-    st.error("❌ Google Cloud Storage not connected")
-    st.info("Please configure GCS authentication in the sidebar to view results.")
+    else:
+        st.error("❌ Google Cloud Storage not connected")
+        st.info("Please configure GCS authentication in the sidebar to view results.")
+
+results_panel(bucket_name, data_folder, gcs_status)
 
 # Footer
 st.markdown("---")
-st.markdown("""
-<div style="text-align: center; color: #666; padding: 1rem;">
-    🔍 Product Extractor Pro | Cloud-First Architecture | Google Cloud Storage Only<br/>
-    <small>Built with Streamlit & LangGraph | No local file storage</small>
-</div>
-""", unsafe_allow_html=True)
-
-# Auto-refresh for real-time updates when extraction is running
-if is_running:
-    time.sleep(3)  # Refresh every 3 seconds
-
-    st.rerun() 
+st.markdown(STATIC_HTML["footer"], unsafe_allow_html=True)
@@ -5,16 +5,577 @@ Clean version with proper WebDriver setup to fix "data:," URL issues
 """
 
 import os
+import re
 import json
 import time
-import requests
+import atexit
+import tempfile
+import contextlib
+import functools
+import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import quote, urljoin
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+
+# Elements that indicate search results have rendered, in priority order
+RESULT_SELECTORS = ("[class*='product']", "[class*='card']", "a[href*='product']")
+SEARCH_RESULTS_READY_SELECTOR = ", ".join(RESULT_SELECTORS)
+
+# Whether the page text contains each of the given lowercase strings
+PAGE_TEXT_CONTAINS_JS = """
+var text = document.body ? (document.body.innerText || '').toLowerCase() : '';
+return arguments[0].map(function(term) { return text.includes(term); });
+"""
+
+# Result count plus whether the results area says there are no results; header, nav and
+# footer matches are left out of the count since they are in the HTML before results render
+RESULTS_STATE_JS = """
+var results = document.querySelector("main, [role='main']") || document.body;
+var text = results ? (results.innerText || '').slice(0, 5000) : '';
+var count = 0;
+document.querySelectorAll(arguments[0]).forEach(function(el) {
+    if (!el.closest("header, nav, footer, [role='banner'], [role='navigation']")) count++;
+});
+return {
+    count: count,
+    noResults: /\\b0\\s+(products|results)\\b|\\bno\\s+(results|products)\\s+found\\b/i.test(text)
+};
+"""
+
+# [selector, count] for the first selector with matches, or null
+FIRST_MATCHING_SELECTOR_JS = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var count = document.querySelectorAll(selectors[i]).length;
+    if (count) return [selectors[i], count];
+}
+return null;
+"""
+
+# Title and product detail sections on the product page, in priority order
+TITLE_SELECTORS = (
+    "h1",
+    ".product-title",
+    ".product-name",
+    "[class*='title']",
+    "[class*='name']",
+    ".item-title",
+    ".product-header h1",
+    ".product-header h2"
+)
+DETAIL_SELECTORS = (
+    ".product-details",
+    ".product-info",
+    ".item-details",
+    ".specifications",
+    ".product-specs",
+    "[class*='detail']",
+    "[class*='spec']",
+    ".product-attributes",
+    ".product-features",
+    ".item-info",
+    ".product-data"
+)
+
+# Visible text of every element matching each selector, in selector order;
+# with a minimum length, only the first text longer than it (or null)
+SELECTOR_TEXTS_JS = """
+var selectors = arguments[0], minLength = arguments[1];
+var texts = [];
+for (var i = 0; i < selectors.length; i++) {
+    var els = document.querySelectorAll(selectors[i]);
+    for (var j = 0; j < els.length; j++) {
+        var el = els[j];
+        if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) continue;
+        var text = (el.innerText || '').trim();
+        if (minLength === null) texts.push(text);
+        else if (text.length > minLength) return text;
+    }
+}
+return minLength === null ? texts : null;
+"""
+
+# Third-party and media requests not needed for extraction
+BLOCKED_URL_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*hotjar.com*",
+    "*segment.io*",
+    "*.woff2",
+    "*.ttf",
+    "*.mp4"
+)
+
+# Candidate selectors for the results page, in strategy priority order
+PRODUCT_CANDIDATE_SELECTORS = (
+    "[class*='product']",
+    "[class*='item']",
+    "[class*='card']",
+    "[class*='result']",
+    ".product-item",
+    ".item",
+    ".card",
+    ".result"
+)
+CLICKABLE_CANDIDATE_SELECTORS = (
+    "a[href]",
+    "button",
+    "[onclick]",
+    "[role='button']"
+)
+SIMPLIFIED_CANDIDATE_SELECTORS = (
+    "a[href]",
+    "[class*='product']",
+    "[class*='item']",
+    ".product-item",
+    ".item"
+)
+
+# Single DOM pass returning every link and candidate element with the fields the strategies filter on
+COLLECT_CANDIDATES_JS = """
+var selectors = arguments[0];
+var candidates = [];
+document.querySelectorAll('a, ' + selectors.join(', ')).forEach(function(el) {
+    var visible = !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    candidates.push({
+        element: el,
+        tag: el.tagName.toLowerCase(),
+        href: el.href || '',
+        text: visible ? (el.innerText || '').trim().slice(0, 200) : '',
+        visible: visible,
+        enabled: !el.disabled,
+        matches: selectors.filter(function(sel) { return el.matches(sel); })
+    });
+});
+return candidates;
+"""
+
+# Case-insensitive text match over visible links and product cards (first 50 matches)
+FIND_BY_TEXT_JS = """
+var text = arguments[0];
+return Array.from(document.querySelectorAll("a, [class*='product'], [class*='card']")).filter(function(el) {
+    return (el.offsetWidth || el.offsetHeight || el.getClientRects().length) &&
+        (el.innerText || '').toLowerCase().includes(text);
+}).slice(0, 50);
+"""
+
+# Candidates inspected and ranked before the click attempts
+MAX_RANKED_CANDIDATES = 50
+
+# Visibility/enabled/tag/href/text for a list of elements, fetched together
+INSPECT_ELEMENTS_JS = """
+return arguments[0].map(function(el) {
+    var visible = !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    return [visible, !el.disabled, el.tagName.toLowerCase(), el.href || '', visible ? (el.innerText || '').trim().slice(0, 80) : ''];
+});
+"""
+
+# Search keyword parsing
+_SPLIT_RE = re.compile(r'[,\s\-_]+')
+_ALNUM_RE = re.compile(r'[A-Za-z]+|\d+')
+SKIP_WORDS = frozenset({'and', 'or', 'the', 'a', 'an', 'with', 'for', 'of', 'in', 'on', 'at', 'to', 'by', 'from'})
+
+# Brand/supplier patterns, compiled once
+BRAND_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'brand[:\s]+([^<\n,]+)',
+    r'manufacturer[:\s]+([^<\n,]+)',
+    r'make[:\s]+([^<\n,]+)'
+))
+SUPPLIER_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'supplier[:\s]+([^<\n,]+)',
+    r'sold by[:\s]+([^<\n,]+)',
+    r'vendor[:\s]+([^<\n,]+)',
+    r'distributed by[:\s]+([^<\n,]+)'
+))
+FALLBACK_BRAND_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Brand[:\s]+([^<\n,]+)',
+    r'Manufacturer[:\s]+([^<\n,]+)',
+    r'Make[:\s]+([^<\n,]+)',
+    r'Tenby',  # Known brand from the data
+    r'Brand[:\s]*([A-Za-z\s]+)'
+))
+FALLBACK_SUPPLIER_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Supplier[:\s]+([^<\n,]+)',
+    r'Vendor[:\s]+([^<\n,]+)',
+    r'Distributor[:\s]+([^<\n,]+)',
+    r'Sold by[:\s]+([^<\n,]+)',
+    r'Khalid and Naeem Trading',  # Known supplier from the data
+    r'Supplier[:\s]*([A-Za-z\s]+)'
+))
+
+# Simplified search term patterns
+_BRAND_PATTERN_RE = re.compile(r'[A-Z]{2,}\s*\d+')
+_PRODUCT_TYPES = ('safety', 'boots', 'goggles', 'gloves', 'helmet', 'vest', 'jacket',
+                  'socket', 'switch', 'cable', 'wire', 'plate', 'screwdriver', 'knife',
+                  'mcb', 'contactor', 'breaker', 'fuse', 'lamp', 'light', 'bulb')
+# Substring match like the old "in" check, so 'switches' still yields 'switch'
+_PRODUCT_TYPE_RE = re.compile('|'.join(map(re.escape, _PRODUCT_TYPES)))
+_ALPHA_WORD_RE = re.compile(r'[A-Za-z]{3,}')
+
+# Basic-info fields filled from the product page
+INFO_FIELDS = ('brand', 'supplier', 'manufactured_country', 'sku', 'model', 'unspsc', 'category', 'main_category')
+_ALLOWED_FIELDS = frozenset(INFO_FIELDS)
+
+# Product page field patterns fused into one alternation; the named group
+# that matched (match.lastgroup) is the product_data key. Each alternative is
+# a zero-width lookahead so a long value (e.g. a brand running into
+# "SKU: ...") does not hide the fields inside it - one scan still finds every
+# match the separate per-field patterns would.
+INFO_RE = re.compile('|'.join(f'(?={pattern})' for pattern in (
+    # Less strict patterns for brand and supplier
+    r'Brand[:\s]+(?P<brand>[^<\n]+?)(?=\s*(?:Supplier|Category|$|\n))',
+    r'Supplier[:\s]+(?P<supplier>[^<\n]+?)(?=\s*(?:Brand|Category|$|\n))',
+    r'(?:Manufactured Country|Manufacturing Country|Origin Country|Country)[:\s]+(?P<manufactured_country>[^<\n,/]+?)(?=\s*(?:Brand|Supplier|$|\n))',
+    # Improved SKU pattern - avoid placeholder text
+    r'(?:SKU|Item Code|Product Code|Part Number)[:\s]+(?P<sku>[A-Za-z0-9\-_\.]+)(?:\s|$)',
+    # Improved Model pattern - avoid placeholder text
+    r'(?:Model|Serial Number|Model Number)[:\s]+(?P<model>[A-Za-z0-9\-_\s\.]+?)(?=\s*(?:Brand|Supplier|$|\n))',
+    # Enhanced UNSPSC pattern
+    r'(?:UNSPSC|UNSPC)[:\s]+(?P<unspsc>[0-9]{8,12})',
+    r'Category[:\s]+(?P<category>[^<\n,/]+?)(?=\s*(?:Brand|Supplier|$|\n))',
+    r'Main Category[:\s]+(?P<main_category>[^<\n,/]+?)(?=\s*(?:Brand|Supplier|$|\n))'
+)), re.IGNORECASE | re.MULTILINE)
+
+# SKU/Model patterns for product detail sections
+DETAIL_SKU_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Item Code[:\s]+([A-Za-z0-9\-_\.]+)',
+    r'SKU[:\s]+([A-Za-z0-9\-_\.]+)',
+    r'Product Code[:\s]+([A-Za-z0-9\-_\.]+)',
+    r'Part Number[:\s]+([A-Za-z0-9\-_\.]+)'
+))
+DETAIL_MODEL_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Serial Number[:\s]+([A-Za-z0-9\-_\s\.]+)',
+    r'Model[:\s]+([A-Za-z0-9\-_\s\.]+)',
+    r'Model Number[:\s]+([A-Za-z0-9\-_\s\.]+)'
+))
+
+# SKU/Model patterns for the whole page source
+PAGE_SKU_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Item Code[:\s]*([A-Za-z0-9\-_\.]+)(?:\s|$|</)',
+    r'SKU[:\s]*([A-Za-z0-9\-_\.]+)(?:\s|$|</)',
+    r'Product Code[:\s]*([A-Za-z0-9\-_\.]+)(?:\s|$|</)',
+    r'Part Number[:\s]*([A-Za-z0-9\-_\.]+)(?:\s|$|</)'
+))
+PAGE_MODEL_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Serial Number[:\s]*([A-Za-z0-9\-_\s\.]+)(?:\s|$|</)',
+    r'Model[:\s]*([A-Za-z0-9\-_\s\.]+)(?:\s|$|</)',
+    r'Model Number[:\s]*([A-Za-z0-9\-_\s\.]+)(?:\s|$|</)'
+))
+
+# Looser SKU/Model patterns used when nothing else matched
+DEBUG_SKU_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Item Code[:\s]*([A-Za-z0-9\-_\.]+)',
+    r'SKU[:\s]*([A-Za-z0-9\-_\.]+)',
+    r'Product Code[:\s]*([A-Za-z0-9\-_\.]+)',
+    r'Code[:\s]*([A-Za-z0-9\-_\.]+)',
+    r'([A-Za-z0-9]{6,10})(?:\s|$|</)'
+))
+DEBUG_MODEL_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Serial Number[:\s]*([A-Za-z0-9\-_\s\.]+)',
+    r'Model[:\s]*([A-Za-z0-9\-_\s\.]+)',
+    r'Model Number[:\s]*([A-Za-z0-9\-_\s\.]+)',
+    r'Serial[:\s]*([A-Za-z0-9\-_\s\.]+)'
+))
+_PRODUCT_CODE_RE = re.compile(r'\b([A-Za-z0-9]{6,10})\b')
+
+# key_attributes label -> (field, priority); lower priority wins when several labels are present
+_ALIAS_MAP = {
+    'Brand': ('brand', 0), 'Manufacturer': ('brand', 1), 'Make': ('brand', 2),
+    'Supplier': ('supplier', 0), 'Vendor': ('supplier', 1), 'Distributor': ('supplier', 2),
+    'SKU': ('sku', 0), 'Item Code': ('sku', 1), 'Product Code': ('sku', 2), 'Part Number': ('sku', 3), 'Code': ('sku', 4),
+    'Model': ('model', 0), 'Serial Number': ('model', 1), 'Model Number': ('model', 2), 'Serial': ('model', 3),
+    'UNSPSC': ('unspsc', 0), 'UNSPC': ('unspsc', 1), 'Classification': ('unspsc', 2)
+}
+
+# Placeholder text picked up instead of a real SKU/Model value
+_INVALID_VALUE_RE = re.compile(
+    r'^(?:[/{]|(?:/\s*)?(?:Item Code|Serial Number):?$)|Feature|Value|Item Code:|Serial Number:'
+)
+_DIGITS_RE = re.compile(r'[0-9]+')
+
+# UNSPSC code patterns, most specific first
+UNSPSC_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'UNSPSC[:\s]*([0-9]{8,12})',
+    r'UNSPC[:\s]*([0-9]{8,12})',
+    r'unspsc code[:\s]*([0-9]{8,12})',
+    r'unspc code[:\s]*([0-9]{8,12})',
+    r'classification[:\s]*([0-9]{8,12})',
+    r'UNSPSC[:\s]*([0-9]{4,4}-[0-9]{2,2}-[0-9]{2,2})',
+    r'UNSPC[:\s]*([0-9]{4,4}-[0-9]{2,2}-[0-9]{2,2})',
+    # Look for 8-12 digit numbers that might be UNSPSC
+    r'([0-9]{8,12})(?:\s|$|</)',
+    # Look for 4-2-2 format
+    r'([0-9]{4,4}-[0-9]{2,2}-[0-9]{2,2})(?:\s|$|</)'
+))
+_NON_CODE_CHARS_RE = re.compile(r'[^0-9\-]')
+_UNSPSC_DIGITS_RE = re.compile(r'[0-9]{8,12}')
+
+_EXACT_CATEGORY_RE = re.compile(
+    r'<span[^>]*title="([^"]*Electrical switches and accessories[^"]*)"[^>]*>', re.IGNORECASE | re.DOTALL
+)
+
+# Cleanup of extracted values
+_INVALID_SUBSTRINGS = (
+    '/ Item Code:',
+    '/ Serial Number:',
+    'Item Code:',
+    'Serial Number:',
+    'Feature',
+    'Value',
+    '{',
+    '}',
+    '/68453e3dce9b0a422ee865ac">',
+    'Feature:',
+    'Value:'
+)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Specification patterns in the page source
+SPEC_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), key) for pattern, key in (
+    (r'Material[:\s]*([^<\n]+)', 'Material'),
+    (r'Color[:\s]*([^<\n]+)', 'Color'),
+    (r'Voltage[:\s]*([^<\n]+)', 'Voltage'),
+    (r'Current[:\s]*([^<\n]+)', 'Current'),
+    (r'Rating[:\s]*([^<\n]+)', 'Rating'),
+    (r'Standard[:\s]*([^<\n]+)', 'Standard'),
+    (r'Gang[:\s]*([^<\n]+)', 'Gang'),
+    (r'Mounting[:\s]*([^<\n]+)', 'Mounting'),
+    (r'Finish[:\s]*([^<\n]+)', 'Finish'),
+    (r'Type[:\s]*([^<\n]+)', 'Type'),
+    (r'Brand[:\s]*([^<\n]+)', 'Brand'),
+    (r'Model[:\s]*([^<\n]+)', 'Model'),
+    (r'UNSPSC[:\s]*([^<\n]+)', 'UNSPSC'),
+    (r'Category[:\s]*([^<\n]+)', 'Category')
+))
+
+
+def _is_valid_value(value):
+    """Check that an extracted SKU/Model value is not empty, oversized or placeholder text"""
+    return bool(value) and len(value) < 200 and not _INVALID_VALUE_RE.search(value)
+
+
+@functools.lru_cache(maxsize=256)
+def _search_keywords(search_term):
+    """Extract meaningful keywords from a search term (cached, returns a tuple)"""
+    # Convert to lowercase and split by common separators
+    keywords = _SPLIT_RE.split(search_term.lower())
+    
+    # Filter out very short or common words
+    filtered_keywords = []
+    for keyword in keywords:
+        keyword = keyword.strip()
+        if (len(keyword) >= 2 and  # At least 2 characters
+            keyword not in SKIP_WORDS and  # Not a common word
+            len(keyword) <= 20):  # Not too long
+            filtered_keywords.append(keyword)
+    
+    # If we don't have enough keywords, try different splitting strategies
+    if len(filtered_keywords) < 2:
+        # Try splitting by numbers and letters
+        alphanumeric_parts = _ALNUM_RE.findall(search_term)
+        for part in alphanumeric_parts:
+            if len(part) >= 2 and part.lower() not in SKIP_WORDS:
+                filtered_keywords.append(part.lower())
+    
+    # If still not enough, use the original search term as a fallback
+    if len(filtered_keywords) < 2:
+        # Use the first few words of the search term
+        words = search_term.split()[:3]
+        for word in words:
+            if len(word) >= 2:
+                filtered_keywords.append(word.lower())
+    
+    # Remove duplicates and limit to most relevant keywords (first 5)
+    unique_keywords = tuple(dict.fromkeys(filtered_keywords))  # Preserve order
+    return unique_keywords[:5]
+
+
+@functools.lru_cache(maxsize=256)
+def _simplified_search_terms(search_term):
+    """Generate simplified search terms for fallback searches (cached, returns a tuple)"""
+    simplified_terms = []
+    
+    # Strategy 1: Use first few words
+    words = search_term.split()
+    if len(words) >= 2:
+        simplified_terms.append(" ".join(words[:2]))  # First 2 words
+    if len(words) >= 3:
+        simplified_terms.append(" ".join(words[:3]))  # First 3 words
+    
+    # Strategy 2: Use main product type words
+    simplified_terms.extend(_PRODUCT_TYPE_RE.findall(search_term.lower()))
+    
+    # Strategy 3: Use brand/model patterns
+    # Look for brand patterns (e.g., "QR 97", "TSP203SB")
+    simplified_terms.extend(_BRAND_PATTERN_RE.findall(search_term))
+    
+    # Strategy 4: Use alphanumeric parts
+    simplified_terms.extend(_ALPHA_WORD_RE.findall(search_term)[:3])  # Limit to first 3 parts
+    
+    # Remove duplicates and limit
+    unique_terms = tuple(dict.fromkeys(simplified_terms))
+    return unique_terms[:5]  # Return first 5 simplified terms
+
+
+@functools.lru_cache(maxsize=256)
+def _keyword_matcher(keywords):
+    """Compile one regex that finds any of the keywords in a single pass over the text"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+class ChromeProfileSlots:
+    """Hands out persistent Chrome profile directories, one per running driver (Chrome locks a profile while in use)"""
+    
+    def __init__(self, base_dir):
+        self.base_dir = base_dir
+        self._in_use = {}  # slot -> open lock file
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Return (slot, profile_dir) for the lowest slot free in this and every other process"""
+        os.makedirs(self.base_dir, exist_ok=True)
+        with self._lock:
+            slot = 0
+            while True:
+                if slot not in self._in_use:
+                    handle = self._lock_file(os.path.join(self.base_dir, f"profile_{slot}.lock"))
+                    if handle:
+                        self._in_use[slot] = handle
+                        break
+                slot += 1
+        return slot, os.path.join(self.base_dir, f"profile_{slot}")
+    
+    def release(self, slot):
+        with self._lock:
+            handle = self._in_use.pop(slot, None)
+        if handle:
+            handle.close()
+    
+    @staticmethod
+    def _lock_file(path):
+        """Take an exclusive non-blocking lock on path; the OS drops it if the process dies"""
+        handle = open(path, 'a+')
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return None
+        return handle
+
+# Profiles survive between runs so Chrome's HTTP cache and V8 code cache stay warm
+_PROFILE_SLOTS = ChromeProfileSlots(os.path.join(tempfile.gettempdir(), "iprocure_chrome_profile"))
+
+
+def _quit_driver(driver):
+    """Quit a driver and free its Chrome profile slot"""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    _PROFILE_SLOTS.release(getattr(driver, 'profile_slot', None))
+
+
+class WebDriverPool:
+    """Keeps warm Chrome instances so extractors can share them instead of starting a new browser each time"""
+    
+    def __init__(self, size=1, max_uses=50):
+        self.size = size  # drivers kept idle between uses
+        self.max_uses = max_uses
+        self._reserved = []  # larger idle limits held by reserve() callers
+        self._idle = {}  # pool key -> idle drivers
+        self._uses = {}  # driver -> completed uses
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)
+    
+    def acquire(self, key, factory):
+        """Return a live idle driver for key, or create one with factory"""
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                driver = idle.pop() if idle else None
+            if driver is None:
+                break
+            if self._is_alive(driver):
+                return driver
+            # Chrome crashed or the session died while the driver sat idle
+            self._quit(driver)
+        
+        driver = factory()
+        with self._lock:
+            self._uses[driver] = 0
+        return driver
+    
+    def release(self, key, driver, discard=False):
+        """Return a driver to the pool, quitting it when discarded, recycled or the pool is full"""
+        with self._lock:
+            uses = self._uses.pop(driver, 0) + 1
+            idle_count = sum(len(drivers) for drivers in self._idle.values())
+            if not discard and uses < self.max_uses and idle_count < self._limit():
+                self._uses[driver] = uses
+                self._idle.setdefault(key, []).append(driver)
+                return
+        self._quit(driver)
+    
+    @contextlib.contextmanager
+    def reserve(self, count):
+        """Keep up to count drivers idle while the block runs, trimming back to size afterwards"""
+        with self._lock:
+            self._reserved.append(count)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._reserved.remove(count)
+                idle_count = sum(len(drivers) for drivers in self._idle.values())
+                excess = []
+                for drivers in self._idle.values():
+                    while drivers and idle_count > self._limit():
+                        excess.append(drivers.pop())
+                        idle_count -= 1
+            for driver in excess:
+                self._quit(driver)
+    
+    def _limit(self):
+        return max([self.size] + self._reserved)
+    
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+    
+    def _quit(self, driver):
+        with self._lock:
+            self._uses.pop(driver, None)
+        _quit_driver(driver)
+    
+    def shutdown(self):
+        """Quit all idle drivers"""
+        with self._lock:
+            drivers = [driver for idle in self._idle.values() for driver in idle]
+            self._idle.clear()
+            self._uses.clear()
+        for driver in drivers:
+            self._quit(driver)
+
+# Shared by every FixedSearchExtractor in the process
+_DRIVER_POOL = WebDriverPool()
 
 
 product_name = "Safety Belts & Harness"
@@ -22,21 +583,90 @@ product_name = "Safety Belts & Harness"
 class FixedSearchExtractor:
     """Fixed version of the search to extraction tool"""
     
-    def __init__(self, headless=False, download_images=True):
+    def __init__(self, headless=False, download_images=True, verify_connectivity=True):
         """Initialize with improved WebDriver setup"""
         self.headless = headless
         self.download_images = download_images
+        self.verify_connectivity = verify_connectivity
+        
+        # page_source cache for the current page (see _page_source)
+        self._cached_page_source = None
+        self._cached_page_source_lower = None
+        self._cached_page_url = None
         self.base_url = "https://www.iprocure.ai"
         
         # Set up logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         
-        # Initialize WebDriver
+        # Shared keep-alive HTTP session for image/asset downloads
+        self.http = self._setup_http_session()
+        
+        # Borrow a warm WebDriver from the pool (set up and connectivity-tested on first use)
+        self._pool_key = (headless, download_images)
+        self.driver = _DRIVER_POOL.acquire(self._pool_key, self._create_driver)
+        self._workflow_failed = False  # set when the workflow raised; the driver is not reused
+    
+    def _create_driver(self):
+        """Start a new WebDriver and check it can reach the internet"""
         self.driver = self._setup_webdriver()
+        if not self.verify_connectivity:
+            return self.driver
+        try:
+            self._test_connectivity()
+        except Exception:
+            _quit_driver(self.driver)
+            raise
+        return self.driver
+    
+    @classmethod
+    def keep_warm(cls, count):
+        """Context manager keeping up to count WebDrivers idle in the shared pool while it is open"""
+        return _DRIVER_POOL.reserve(count)
+    
+    @classmethod
+    def batch(cls, product_names, workers=4, headless=True, download_images=True):
+        """Run the complete workflow for several products in parallel, sharing pooled drivers"""
+        def run(name):
+            extractor = None
+            failed = False
+            try:
+                extractor = cls(headless=headless, download_images=download_images)
+                return extractor.run_complete_workflow(name)
+            except Exception as e:
+                failed = True
+                logging.getLogger(__name__).error(f"Batch extraction failed for '{name}': {e}")
+                return None
+            finally:
+                if extractor:
+                    extractor.close(discard=failed)
+        
+        with cls.keep_warm(workers), ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(product_names, executor.map(run, product_names)))
+    
+    def _setup_http_session(self):
+        """Create a pooled requests session reused for every download"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
         
-        # Test connectivity
-        self._test_connectivity()
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def _sync_http_cookies(self):
+        """Copy browser cookies into the HTTP session so authenticated asset URLs work"""
+        try:
+            for cookie in self.driver.get_cookies():
+                self.http.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/'))
+        except Exception as e:
+            self.logger.debug(f"Could not copy browser cookies: {e}")
     
     def _setup_webdriver(self):
         """Set up WebDriver with multiple fallback options"""
@@ -51,7 +681,12 @@ class FixedSearchExtractor:
                     "--disable-gpu",
                     "--disable-extensions",
                     "--disable-web-security",
-                    "--allow-running-insecure-content"
+                    "--allow-running-insecure-content",
+                    "--disable-background-networking",
+                    "--disable-sync",
+                    "--disable-default-apps",
+                    "--no-first-run",
+                    "--disable-features=Translate,BackForwardCache"
                 ]
             },
             {
@@ -68,6 +703,22 @@ class FixedSearchExtractor:
             for option_set in option_sets:
                 option_set["options"].append("--headless")
         
+        # Reuse a persistent profile; the bare Basic Setup stays profile-less in case the directory is locked
+        profile_slot, profile_dir = _PROFILE_SLOTS.acquire()
+        for option_set in option_sets[:2]:
+            option_set["options"] += [
+                f"--user-data-dir={profile_dir}",
+                "--profile-directory=Default",
+                "--disk-cache-size=104857600"
+            ]
+        
+        # Skip notification prompts, and image loading when images are not being downloaded
+        # (set both ways, since content settings persist in the shared profile)
+        prefs = {
+            "profile.default_content_setting_values.notifications": 2,
+            "profile.managed_default_content_settings.images": 1 if self.download_images else 2
+        }
+        
         for option_set in option_sets:
             try:
                 self.logger.info(f"Trying: {option_set['name']}")
@@ -75,25 +726,53 @@ class FixedSearchExtractor:
                 options = Options()
                 for option in option_set["options"]:
                     options.add_argument(option)
+                options.add_experimental_option("prefs", prefs)
                 
                 driver = webdriver.Chrome(options=options)
                 self.logger.info(f"✅ Success: {option_set['name']}")
+                if f"--user-data-dir={profile_dir}" in option_set["options"]:
+                    driver.profile_slot = profile_slot
+                else:
+                    _PROFILE_SLOTS.release(profile_slot)
+                self._block_tracking_requests(driver)
                 return driver
                 
             except Exception as e:
                 self.logger.warning(f"❌ Failed: {option_set['name']} - {e}")
                 continue
         
+        _PROFILE_SLOTS.release(profile_slot)
         raise Exception("Could not initialize WebDriver. Please check Chrome installation.")
     
+    def _block_tracking_requests(self, driver):
+        """Block analytics, ad and font requests at the network layer"""
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
+        except Exception as e:
+            self.logger.debug(f"Could not set blocked URLs: {e}")
+    
     def _test_connectivity(self):
         """Test WebDriver connectivity"""
         try:
             self.logger.info("Testing connectivity...")
             
-            # Test Google first
+            # Cheap HTTP probe of the target site first
+            import requests
+            try:
+                response = self.http.head(self.base_url, timeout=3, allow_redirects=True)
+                if response.status_code < 500:
+                    self.logger.info(f"✅ Connectivity test passed ({self.base_url} -> {response.status_code})")
+                    return
+            except requests.RequestException as e:
+                self.logger.info(f"HTTP probe failed ({e}), testing through the browser")
+            
+            # Fall back to a full browser navigation
             self.driver.get("https://www.google.com")
-            time.sleep(3)
+            try:
+                WebDriverWait(self.driver, 5).until(lambda driver: driver.current_url != "data:,")
+            except TimeoutException:
+                pass
             
             current_url = self.driver.current_url
             self.logger.info(f"Test URL result: {current_url}")
@@ -121,7 +800,8 @@ class FixedSearchExtractor:
             
             # Navigate to search URL
             self.driver.get(search_url)
-            time.sleep(5)
+            self._invalidate_page_source()
+            self._wait_for_search_results(10)
             
             current_url = self.driver.current_url
             page_title = self.driver.title
@@ -129,46 +809,28 @@ class FixedSearchExtractor:
             self.logger.info(f"Current URL: {current_url}")
             self.logger.info(f"Page title: {page_title}")
             
-            # Check page content
-            page_source = self.driver.page_source.lower()
+            # Check page text for the search term and known products in one call
+            contains_search_term, contains_tenby, contains_blank_plate = self.driver.execute_script(
+                PAGE_TEXT_CONTAINS_JS, [search_term.lower(), 'tenby', 'blank plate']
+            )
             
             results = {
                 'search_url': search_url,
                 'final_url': current_url,
                 'page_title': page_title,
-                'contains_search_term': search_term.lower() in page_source,
-                'contains_tenby': 'tenby' in page_source,
-                'contains_blank_plate': 'blank plate' in page_source,
+                'contains_search_term': contains_search_term,
+                'contains_tenby': contains_tenby,
+                'contains_blank_plate': contains_blank_plate,
                 'product_elements_found': 0
             }
             
             # Look for product elements
-            product_selectors = [
-                "div:contains('Blank Plate')",
-                "div:contains('Tenby')",
-                "[class*='product']",
-                "[class*='card']",
-                "a[href*='product']"
-            ]
+            found = self._first_matching_selector(RESULT_SELECTORS)
             
-            for selector in product_selectors:
-                try:
-                    if "contains" in selector:
-                        # Use XPath for text search
-                        text = selector.split("'")[1]
-                        xpath = f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{text.lower()}')]"
-                        elements = self.driver.find_elements(By.XPATH, xpath)
-                    else:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    if elements:
-                        results['product_elements_found'] += len(elements)
-                        self.logger.info(f"Found {len(elements)} elements with: {selector}")
-                        break
-                        
-                except Exception as e:
-                    self.logger.debug(f"Selector failed {selector}: {e}")
-                    continue
+            if found:
+                selector, count = found
+                results['product_elements_found'] += count
+                self.logger.info(f"Found {count} elements with: {selector}")
             
             return results
             
@@ -176,6 +838,171 @@ class FixedSearchExtractor:
             self.logger.error(f"Search URL test failed: {e}")
             return {'error': str(e)}
     
+    def _page_source(self):
+        """Return the current page HTML, fetched at most once per page until invalidated"""
+        current_url = self.driver.current_url
+        if self._cached_page_source is None or self._cached_page_url != current_url:
+            self._cached_page_source = self.driver.page_source
+            self._cached_page_source_lower = None
+            self._cached_page_url = current_url
+        return self._cached_page_source
+    
+    def _page_source_lower(self):
+        """Lowercased copy of _page_source(), computed once per page"""
+        page_source = self._page_source()
+        if self._cached_page_source_lower is None:
+            self._cached_page_source_lower = page_source.lower()
+        return self._cached_page_source_lower
+    
+    def _invalidate_page_source(self):
+        """Drop the cached HTML after anything that may change the page"""
+        self._cached_page_source = None
+        self._cached_page_source_lower = None
+        self._cached_page_url = None
+    
+    def _results_state(self):
+        """Return {'count', 'noResults'} for the current results page in one script call"""
+        try:
+            return self.driver.execute_script(RESULTS_STATE_JS, SEARCH_RESULTS_READY_SELECTOR)
+        except Exception as e:
+            self.logger.debug(f"Results state check failed: {e}")
+            return None
+    
+    def _wait_for_search_results(self, timeout):
+        """Wait until the result count is non-zero and unchanged for two polls, or a "no results"
+        message appears; returns the final results state"""
+        previous_count = None
+        
+        def settled(driver):
+            nonlocal previous_count
+            state = self._results_state()
+            if not state:
+                return False
+            if state['noResults']:
+                return state
+            stable = state['count'] and state['count'] == previous_count
+            previous_count = state['count']
+            return state if stable else False
+        
+        try:
+            return WebDriverWait(self.driver, timeout).until(settled)
+        except TimeoutException:
+            self.logger.debug(f"No search result elements after {timeout}s")
+            return None
+    
+    def _collect_candidates(self):
+        """Return tag/href/text/visibility for every link and product-like element in one script call"""
+        try:
+            return self.driver.execute_script(
+                COLLECT_CANDIDATES_JS, list(PRODUCT_CANDIDATE_SELECTORS + CLICKABLE_CANDIDATE_SELECTORS)
+            ) or []
+        except Exception as e:
+            self.logger.debug(f"Candidate collection failed: {e}")
+            return []
+    
+    def _find_elements_with_text(self, text):
+        """Return visible links/product cards whose text contains the given text (case-insensitive)"""
+        try:
+            return self.driver.execute_script(FIND_BY_TEXT_JS, text.lower()) or []
+        except Exception as e:
+            self.logger.debug(f"Text search failed for {text}: {e}")
+            return []
+    
+    def _first_matching_selector(self, selectors):
+        """Return (selector, count) for the first selector with matches, in one script call"""
+        try:
+            found = self.driver.execute_script(FIRST_MATCHING_SELECTOR_JS, list(selectors))
+            return tuple(found) if found else None
+        except Exception as e:
+            self.logger.debug(f"Selector count failed: {e}")
+            return None
+    
+    def _selector_texts(self, selectors, min_length=None):
+        """Return visible element texts for the selectors in one script call, or the first longer than min_length"""
+        try:
+            return self.driver.execute_script(SELECTOR_TEXTS_JS, list(selectors), min_length)
+        except Exception as e:
+            self.logger.debug(f"Selector text lookup failed: {e}")
+            return None
+    
+    def _inspect_elements(self, elements):
+        """Return (element, visible, enabled, tag, href, text) for each element in one script call"""
+        if not elements:
+            return []
+        try:
+            details = self.driver.execute_script(INSPECT_ELEMENTS_JS, elements)
+            return [(element, *detail) for element, detail in zip(elements, details)]
+        except Exception as e:
+            self.logger.debug(f"Element inspection failed: {e}")
+            return []
+    
+    def _pick_candidates(self, candidates, selectors, min_text_length=0):
+        """Return (selector, elements) for the first selector with visible, enabled matches"""
+        for selector in selectors:
+            elements = [
+                candidate['element'] for candidate in candidates
+                if selector in candidate['matches']
+                and candidate['visible'] and candidate['enabled']
+                and len(candidate['text']) >= min_text_length
+            ]
+            if elements:
+                return selector, elements
+        return None, []
+    
+    def _search_simplified_terms(self, simplified_terms):
+        """Load every simplified search in its own tab at once, then take the first term with results"""
+        original_handle = self.driver.current_window_handle
+        tabs = []
+        
+        # Start all navigations without waiting for each page to load
+        for simplified_term in simplified_terms:
+            try:
+                encoded_term = quote(simplified_term)
+                search_url = f"https://www.iprocure.ai/product-search-result?query={encoded_term}&type=Products"
+                self.driver.switch_to.new_window('tab')
+                self.driver.execute_script("window.location.href = arguments[0];", search_url)
+                tabs.append((simplified_term, self.driver.current_window_handle))
+            except Exception as e:
+                self.logger.debug(f"Simplified search failed for '{simplified_term}': {e}")
+        
+        # Check the tabs in priority order; later pages keep loading while earlier ones are checked
+        clickable_elements = []
+        winner = None
+        for simplified_term, handle in tabs:
+            try:
+                self.driver.switch_to.window(handle)
+                state = self._wait_for_search_results(8)
+                if state and state['noResults'] and not state['count']:
+                    self.logger.info(f"   No results for simplified term '{simplified_term}'")
+                    continue
+                
+                # Look for any clickable elements
+                selector, clickable_elements = self._pick_candidates(
+                    self._collect_candidates(), SIMPLIFIED_CANDIDATE_SELECTORS, min_text_length=6
+                )
+                
+                if clickable_elements:
+                    self.logger.info(f"   Found elements with simplified term '{simplified_term}'")
+                    winner = handle
+                    break
+                    
+            except Exception as e:
+                self.logger.debug(f"Simplified search failed for '{simplified_term}': {e}")
+                continue
+        
+        # Leave a single tab open: the one with results, or the original search page
+        self._invalidate_page_source()
+        keep = winner or original_handle
+        for handle in [original_handle] + [handle for _, handle in tabs]:
+            if handle != keep:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except Exception:
+                    pass
+        self.driver.switch_to.window(keep)
+        return clickable_elements
+    
     def find_and_click_product(self, search_term=product_name):
         """Find and click on a product from search results"""
         try:
@@ -192,18 +1019,14 @@ class FixedSearchExtractor:
             
             # Strategy 1: Look for elements containing search term keywords
             search_keywords = self._extract_search_keywords(search_term)
+            keyword_re = _keyword_matcher(tuple(search_keywords)) if search_keywords else None
             self.logger.info(f"   Searching for keywords: {search_keywords}")
             
             for keyword in search_keywords:
                 try:
-                    xpath = f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{keyword}')]"
-                    elements = self.driver.find_elements(By.XPATH, xpath)
+                    # Only visible matches are returned
+                    clickable_elements.extend(self._find_elements_with_text(keyword))
                     
-                    for element in elements:
-                        # Check if element or its parent is clickable
-                        if element.is_displayed():
-                            clickable_elements.append(element)
-                            
                     if clickable_elements:
                         self.logger.info(f"   Found elements containing: {keyword}")
                         break
@@ -212,74 +1035,33 @@ class FixedSearchExtractor:
                     self.logger.debug(f"Text search failed for {keyword}: {e}")
                     continue
             
+            # Collect every candidate on the results page in one browser round trip
+            candidates = self._collect_candidates() if not clickable_elements else []
+            
             # Strategy 2: Look for any links containing search keywords
             if not clickable_elements:
-                try:
-                    search_keywords = self._extract_search_keywords(search_term)
-                    links = self.driver.find_elements(By.TAG_NAME, "a")
-                    for link in links:
-                        href = link.get_attribute("href") or ""
-                        text = link.text.lower()
-                        
-                        # Check if link contains product URL or search keywords
-                        if (href and 'product' in href) or any(keyword in text for keyword in search_keywords):
-                            clickable_elements.append(link)
-                            
-                except Exception as e:
-                    self.logger.debug(f"Link search failed: {e}")
+                for candidate in candidates:
+                    if candidate['tag'] != 'a':
+                        continue
+                    href = candidate['href']
+                    text = candidate['text'].lower()
+                    
+                    # Check if link contains product URL or search keywords
+                    if (href and 'product' in href) or (keyword_re and keyword_re.search(text)):
+                        clickable_elements.append(candidate['element'])
             
             # Strategy 3: Look for any clickable elements with product-related classes
             if not clickable_elements:
-                try:
-                    product_selectors = [
-                        "[class*='product']",
-                        "[class*='item']",
-                        "[class*='card']",
-                        "[class*='result']",
-                        ".product-item",
-                        ".item",
-                        ".card",
-                        ".result"
-                    ]
-                    
-                    for selector in product_selectors:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        for element in elements:
-                            if element.is_displayed() and element.is_enabled():
-                                clickable_elements.append(element)
-                        
-                        if clickable_elements:
-                            self.logger.info(f"   Found elements with selector: {selector}")
-                            break
-                            
-                except Exception as e:
-                    self.logger.debug(f"Product selector search failed: {e}")
+                selector, clickable_elements = self._pick_candidates(candidates, PRODUCT_CANDIDATE_SELECTORS)
+                if clickable_elements:
+                    self.logger.info(f"   Found elements with selector: {selector}")
             
             # Strategy 4: Look for any clickable elements (fallback)
             if not clickable_elements:
-                try:
-                    # Look for any clickable elements that might be products
-                    clickable_selectors = [
-                        "a[href]",
-                        "button",
-                        "[onclick]",
-                        "[role='button']"
-                    ]
-                    
-                    for selector in clickable_selectors:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        for element in elements:
-                            if element.is_displayed() and element.is_enabled():
-                                text = element.text.strip()
-                                if text and len(text) > 5:  # Has substantial text
-                                    clickable_elements.append(element)
-                        
-                        if len(clickable_elements) > 0:
-                            self.logger.info(f"   Found clickable elements with selector: {selector}")
-                            break
-                            
-                except Exception as e:
-                    self.logger.debug(f"Clickable element search failed: {e}")
+                # Look for any clickable elements that might be products
+                selector, clickable_elements = self._pick_candidates(candidates, CLICKABLE_CANDIDATE_SELECTORS, min_text_length=6)
+                if clickable_elements:
+                    self.logger.info(f"   Found clickable elements with selector: {selector}")
             
             if not clickable_elements:
                 self.logger.warning("No clickable product elements found with original search term")
@@ -288,41 +1070,18 @@ class FixedSearchExtractor:
                 simplified_terms = self._get_simplified_search_terms(search_term)
                 self.logger.info(f"   Trying simplified search terms: {simplified_terms}")
                 
-                for simplified_term in simplified_terms:
-                    try:
-                        # Navigate to search with simplified term
-                        encoded_term = quote(simplified_term)
-                        search_url = f"https://www.iprocure.ai/product-search-result?query={encoded_term}&type=Products"
-                        self.driver.get(search_url)
-                        time.sleep(3)
-                        
-                        # Look for any clickable elements
-                        clickable_selectors = [
-                            "a[href]",
-                            "[class*='product']",
-                            "[class*='item']",
-                            ".product-item",
-                            ".item"
-                        ]
-                        
-                        for selector in clickable_selectors:
-                            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                            for element in elements:
-                                if element.is_displayed() and element.is_enabled():
-                                    text = element.text.strip()
-                                    if text and len(text) > 5:
-                                        clickable_elements.append(element)
-                            
-                            if clickable_elements:
-                                self.logger.info(f"   Found elements with simplified term '{simplified_term}'")
-                                break
-                        
+                # Plenty of products on the page that just didn't match: look for the simpler
+                # terms here before navigating to new searches
+                state = self._results_state()
+                if state and state['count'] > 10:
+                    for simplified_term in simplified_terms:
+                        clickable_elements = self._find_elements_with_text(simplified_term)
                         if clickable_elements:
+                            self.logger.info(f"   Found elements with simplified term '{simplified_term}' on the current page")
                             break
-                            
-                    except Exception as e:
-                        self.logger.debug(f"Simplified search failed for '{simplified_term}': {e}")
-                        continue
+                
+                if not clickable_elements:
+                    clickable_elements = self._search_simplified_terms(simplified_terms)
                 
                 if not clickable_elements:
                     self.logger.warning("No clickable product elements found even with simplified terms")
@@ -331,18 +1090,38 @@ class FixedSearchExtractor:
                 self._debug_page_content(search_term)
                 return None
             
-            # Try to click on the first promising element
-            for element in clickable_elements[:5]:  # Try more elements
+            # Read tag/href/text/visibility for the candidates in one call, then try the
+            # most promising visible ones first: product links, keyword matches, anything with text
+            clickable_elements = list(dict.fromkeys(clickable_elements))[:MAX_RANKED_CANDIDATES]
+            inspected = self._inspect_elements(clickable_elements) or [
+                (element, True, True, '', '', '') for element in clickable_elements
+            ]
+            
+            def click_priority(item):
+                element, visible, enabled, tag, href, text = item
+                if 'product' in href:
+                    return 3
+                if keyword_re and keyword_re.search(text.lower()):
+                    return 2
+                return 1 if text else 0
+            
+            # Only displayed and enabled candidates are worth a click attempt
+            ranked = sorted((item for item in inspected if item[1] and item[2]), key=click_priority, reverse=True)
+            
+            # Clicks that don't navigate leave the URL unchanged, so read it once
+            before_url = self.driver.current_url
+            
+            for element, visible, enabled, tag, href, text in ranked[:5]:  # Try more elements
                 try:
-                    element_text = element.text.strip()[:50] if element.text else "Unknown element"
+                    element_text = text[:50] if text else "Unknown element"
                     self.logger.info(f"Attempting to click element: {element_text}")
                     
                     # Scroll to element
                     self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                    time.sleep(1)
-                    
-                    # Get current URL before clicking
-                    before_url = self.driver.current_url
+                    try:
+                        WebDriverWait(self.driver, 2).until(EC.element_to_be_clickable(element))
+                    except TimeoutException:
+                        pass
                     
                     # Try different click methods
                     try:
@@ -357,16 +1136,18 @@ class FixedSearchExtractor:
                             from selenium.webdriver.common.action_chains import ActionChains
                             ActionChains(self.driver).move_to_element(element).click().perform()
                     
-                    time.sleep(3)
-                    
-                    # Check if URL changed (indicating navigation)
-                    after_url = self.driver.current_url
+                    self._invalidate_page_source()
                     
-                    if after_url != before_url:
-                        self.logger.info(f"✅ Successfully clicked and navigated to: {after_url}")
-                        return after_url
-                    else:
+                    # A URL change indicates navigation
+                    try:
+                        WebDriverWait(self.driver, 5, poll_frequency=0.2).until(EC.url_changes(before_url))
+                    except TimeoutException:
                         self.logger.debug("Click didn't result in navigation, trying next element")
+                        continue
+                    
+                    after_url = self.driver.current_url
+                    self.logger.info(f"✅ Successfully clicked and navigated to: {after_url}")
+                    return after_url
                         
                 except Exception as e:
                     self.logger.debug(f"Click failed: {e}")
@@ -388,115 +1169,27 @@ class FixedSearchExtractor:
     
     def _extract_search_keywords(self, search_term):
         """Extract meaningful keywords from search term for dynamic searching"""
-        import re
-        
-        # Convert to lowercase and split by common separators
-        keywords = re.split(r'[,\s\-_]+', search_term.lower())
-        
-        # Filter out very short or common words
-        filtered_keywords = []
-        skip_words = {'and', 'or', 'the', 'a', 'an', 'with', 'for', 'of', 'in', 'on', 'at', 'to', 'by', 'from'}
-        
-        for keyword in keywords:
-            keyword = keyword.strip()
-            if (len(keyword) >= 2 and  # At least 2 characters
-                keyword not in skip_words and  # Not a common word
-                len(keyword) <= 20):  # Not too long
-                filtered_keywords.append(keyword)
-        
-        # If we don't have enough keywords, try different splitting strategies
-        if len(filtered_keywords) < 2:
-            # Try splitting by numbers and letters
-            alphanumeric_parts = re.findall(r'[A-Za-z]+|\d+', search_term)
-            for part in alphanumeric_parts:
-                if len(part) >= 2 and part.lower() not in skip_words:
-                    filtered_keywords.append(part.lower())
-        
-        # If still not enough, use the original search term as a fallback
-        if len(filtered_keywords) < 2:
-            # Use the first few words of the search term
-            words = search_term.split()[:3]
-            for word in words:
-                if len(word) >= 2:
-                    filtered_keywords.append(word.lower())
-        
-        # Remove duplicates and limit to most relevant keywords (first 5)
-        unique_keywords = list(dict.fromkeys(filtered_keywords))  # Preserve order
-        return unique_keywords[:5]
+        return list(_search_keywords(search_term))
     
     def _get_simplified_search_terms(self, search_term):
         """Generate simplified search terms for fallback searches"""
-        simplified_terms = []
-        
-        # Strategy 1: Use first few words
-        words = search_term.split()
-        if len(words) >= 2:
-            simplified_terms.append(" ".join(words[:2]))  # First 2 words
-        if len(words) >= 3:
-            simplified_terms.append(" ".join(words[:3]))  # First 3 words
-        
-        # Strategy 2: Use main product type words
-        product_types = ['safety', 'boots', 'goggles', 'gloves', 'helmet', 'vest', 'jacket', 
-                        'socket', 'switch', 'cable', 'wire', 'plate', 'screwdriver', 'knife', 
-                        'mcb', 'contactor', 'breaker', 'fuse', 'lamp', 'light', 'bulb']
-        
-        search_lower = search_term.lower()
-        for product_type in product_types:
-            if product_type in search_lower:
-                simplified_terms.append(product_type)
-        
-        # Strategy 3: Use brand/model patterns
-        import re
-        # Look for brand patterns (e.g., "QR 97", "TSP203SB")
-        brand_patterns = re.findall(r'[A-Z]{2,}\s*\d+', search_term)
-        for pattern in brand_patterns:
-            simplified_terms.append(pattern)
-        
-        # Strategy 4: Use alphanumeric parts
-        alphanumeric_parts = re.findall(r'[A-Za-z]{3,}', search_term)
-        for part in alphanumeric_parts[:3]:  # Limit to first 3 parts
-            if len(part) >= 3:
-                simplified_terms.append(part)
-        
-        # Remove duplicates and limit
-        unique_terms = list(dict.fromkeys(simplified_terms))
-        return unique_terms[:5]  # Return first 5 simplified terms
+        return list(_simplified_search_terms(search_term))
     
     def _extract_title_and_basic_info(self, product_data):
         """Extract title and enhanced basic product information with improved parsing"""
         try:
-            page_source = self.driver.page_source.lower()
-            page_text = self.driver.page_source
+            page_text = self._page_source()
             
             # Extract title from multiple sources
-            title_selectors = [
-                "h1",
-                ".product-title", 
-                ".product-name",
-                "[class*='title']",
-                "[class*='name']",
-                ".item-title",
-                ".product-header h1",
-                ".product-header h2"
-            ]
-            
-            for selector in title_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if text and len(text) > 5:
-                            product_data['title'] = text
-                            product_data['extraction_success']['title'] = True
-                            self.logger.info(f"   Found title: {text}")
-                            break
-                    if product_data['title']:
-                        break
-                except:
-                    continue
+            text = self._selector_texts(TITLE_SELECTORS, min_length=5)
+            if text:
+                product_data['title'] = text
+                product_data['extraction_success']['title'] = True
+                self.logger.info(f"   Found title: {text}")
             
             # Fallback title extraction
             if not product_data['title']:
+                page_source = self._page_source_lower()
                 search_keywords = self._extract_search_keywords(product_name)
                 for keyword in search_keywords:
                     if keyword in page_source and len(keyword) > 3:
@@ -508,83 +1201,86 @@ class FixedSearchExtractor:
             js_script = """
             var info = {};
             
+            // Only the fields Python has not filled yet are looked for
+            var needed = arguments[0];
+            var remaining = function() {
+                return needed.some(function(field) { return !info[field]; });
+            };
+            
+            // Label fragment -> field, checked in order until an unfilled field matches
+            var KEYMAP = [
+                ['brand', 'brand'], ['supplier', 'supplier'],
+                ['country', 'manufactured_country'], ['origin', 'manufactured_country'], ['manufactured', 'manufactured_country'],
+                ['sku', 'sku'], ['item code', 'sku'], ['product code', 'sku'], ['part number', 'sku'],
+                ['model', 'model'], ['serial', 'model'],
+                ['unspsc', 'unspsc'], ['unspc', 'unspsc']
+            ];
+            var assignField = function(key, value) {
+                for (var i = 0; i < KEYMAP.length; i++) {
+                    var field = KEYMAP[i][1];
+                    if (!info[field] && needed.indexOf(field) >= 0 && key.indexOf(KEYMAP[i][0]) >= 0) {
+                        info[field] = value;
+                        return;
+                    }
+                }
+                if (!info.category && key.indexOf('category') >= 0) {
+                    var categoryField = key.indexOf('main') >= 0 ? 'main_category' : 'category';
+                    if (needed.indexOf(categoryField) >= 0) info[categoryField] = value;
+                }
+            };
+            
             // Strategy 1: Look for key-value pairs in the page
             var extractInfo = function() {
+                if (!remaining()) return info;
                 var text = document.body.innerText || document.body.textContent || '';
-                var lines = text.split('\\n');
                 
-                for (var i = 0; i < lines.length; i++) {
-                    var line = lines[i].trim();
+                // Look for "Label: Value" lines with one regex step per match
+                var labelValue = /^[ \\t]*([^:\\n]{1,60}):[ \\t]*(.+)$/gm;
+                var m;
+                
+                while ((m = labelValue.exec(text)) !== null) {
+                    var key = m[1].trim().toLowerCase();
                     
-                    // Skip empty lines
-                    if (!line) continue;
+                    // Clean up the value - remove leading/trailing special chars
+                    var value = m[2].replace(/^[^a-zA-Z0-9]+/, '').replace(/[^a-zA-Z0-9]+$/, '');
                     
-                    // Look for "Label: Value" patterns
-                    if (line.includes(':')) {
-                        var parts = line.split(':');
-                        if (parts.length >= 2) {
-                            var key = parts[0].trim().toLowerCase();
-                            var value = parts.slice(1).join(':').trim();
-                            
-                            // Clean up the value - remove leading/trailing special chars
-                            value = value.replace(/^[^a-zA-Z0-9]+/, '').replace(/[^a-zA-Z0-9]+$/, '');
-                            
-                            // Skip if value is empty, too short, or contains unwanted patterns
-                            // But be less strict for brand and supplier fields
-                            if (!value || value.length < 1) {
-                                continue;
-                            }
-                            
-                            // Only apply strict validation for SKU and Model fields
-                            if ((key.includes('sku') || key.includes('item code') || key.includes('product code') || key.includes('part number') ||
-                                 key.includes('model') || key.includes('serial number') || key.includes('model number')) &&
-                                (value.includes('Item Code:') || 
-                                 value.includes('Serial Number:') ||
-                                 value === '/ Item Code:' ||
-                                 value === '/ Serial Number:' ||
-                                 value === 'Item Code:' ||
-                                 value === 'Serial Number:' ||
-                                 value.startsWith('/') ||
-                                 value.startsWith('{') ||
-                                 value.includes('Feature') ||
-                                 value.includes('Value'))) {
-                                continue;
-                            }
-                            
-                            // Map to fields
-                            if (key.includes('brand') && !info.brand) {
-                                info.brand = value;
-                            } else if (key.includes('supplier') && !info.supplier) {
-                                info.supplier = value;
-                            } else if ((key.includes('country') || key.includes('origin') || key.includes('manufactured')) && !info.manufactured_country) {
-                                info.manufactured_country = value;
-                            } else if ((key.includes('sku') || key.includes('item code') || key.includes('product code') || key.includes('part number')) && !info.sku) {
-                                info.sku = value;
-                            } else if ((key.includes('model') || key.includes('serial number') || key.includes('model number')) && !info.model) {
-                                info.model = value;
-                            } else if ((key.includes('unspsc') || key.includes('unspc')) && !info.unspsc) {
-                                info.unspsc = value;
-                            } else if (key.includes('category') && !info.category) {
-                                if (key.includes('main')) {
-                                    info.main_category = value;
-                                } else {
-                                    info.category = value;
-                                }
-                            }
-                        }
+                    // Skip if value is empty
+                    // But be less strict for brand and supplier fields
+                    if (!key || !value) {
+                        continue;
                     }
+                    
+                    // Only apply strict validation for SKU and Model fields
+                    if ((key.includes('sku') || key.includes('item code') || key.includes('product code') || key.includes('part number') ||
+                         key.includes('model') || key.includes('serial number') || key.includes('model number')) &&
+                        (value.includes('Item Code:') || 
+                         value.includes('Serial Number:') ||
+                         value === '/ Item Code:' ||
+                         value === '/ Serial Number:' ||
+                         value === 'Item Code:' ||
+                         value === 'Serial Number:' ||
+                         value.startsWith('/') ||
+                         value.startsWith('{') ||
+                         value.includes('Feature') ||
+                         value.includes('Value'))) {
+                        continue;
+                    }
+                    
+                    // Map to fields
+                    assignField(key, value);
                 }
                 
                 return info;
             };
             
             // Strategy 2: Look for definition lists and tables
-            document.querySelectorAll('dl').forEach(dl => {
-                var dts = dl.querySelectorAll('dt');
-                var dds = dl.querySelectorAll('dd');
-                for (var i = 0; i < Math.min(dts.length, dds.length); i++) {
-                    var key = (dts[i].textContent || '').trim().toLowerCase();
-                    var value = (dds[i].textContent || '').trim();
+            var allDts = remaining() ? document.querySelectorAll('dl dt') : [];
+            for (var i = 0; i < allDts.length; i++) {
+                // Pair each term with the description that follows it
+                var dd = allDts[i].nextElementSibling;
+                if (dd && dd.tagName === 'DD') {
+                    var key = (allDts[i].textContent || '').trim().toLowerCase();
+                    var value = (dd.textContent || '').trim();
                     
                     // Clean value
                     if (value && value.length > 0 && value.length < 200 && 
@@ -593,23 +1289,15 @@ class FixedSearchExtractor:
                         !value.startsWith('/') && !value.startsWith('{') &&
                         !value.includes('Feature') && !value.includes('Value')) {
                         
-                        if (key.includes('brand') && !info.brand) info.brand = value;
-                        if (key.includes('supplier') && !info.supplier) info.supplier = value;
-                        if ((key.includes('country') || key.includes('origin')) && !info.manufactured_country) info.manufactured_country = value;
-                        if ((key.includes('sku') || key.includes('item code') || key.includes('product code')) && !info.sku) info.sku = value;
-                        if ((key.includes('model') || key.includes('serial')) && !info.model) info.model = value;
-                        if ((key.includes('unspsc') || key.includes('unspc')) && !info.unspsc) info.unspsc = value;
-                        if (key.includes('category') && !info.category) {
-                            if (key.includes('main')) info.main_category = value;
-                            else info.category = value;
-                        }
+                        assignField(key, value);
                     }
                 }
-            });
+            }
             
             // Strategy 3: Look for table rows with better parsing
-            document.querySelectorAll('table tr').forEach(row => {
-                var cells = row.querySelectorAll('td, th');
+            var allRows = remaining() ? document.querySelectorAll('table tr') : [];
+            for (var r = 0; r < allRows.length; r++) {
+                var cells = allRows[r].cells;
                 if (cells.length >= 2) {
                     var key = (cells[0].textContent || '').trim().toLowerCase();
                     var value = (cells[1].textContent || '').trim();
@@ -622,89 +1310,52 @@ class FixedSearchExtractor:
                             value.startsWith('/') || value.startsWith('{') ||
                             value.includes('Feature') || value.includes('Value') ||
                             (value.includes('/') && value.length < 5)) {
-                            return;
+                            continue;
                         }
                         
-                        if (key.includes('brand') && !info.brand) info.brand = value;
-                        if (key.includes('supplier') && !info.supplier) info.supplier = value;
-                        if ((key.includes('country') || key.includes('origin')) && !info.manufactured_country) info.manufactured_country = value;
-                        if ((key.includes('sku') || key.includes('item code') || key.includes('product code')) && !info.sku) info.sku = value;
-                        if ((key.includes('model') || key.includes('serial')) && !info.model) info.model = value;
-                        if ((key.includes('unspsc') || key.includes('unspc')) && !info.unspsc) info.unspsc = value;
-                        if (key.includes('category') && !info.category) {
-                            if (key.includes('main')) info.main_category = value;
-                            else info.category = value;
-                        }
+                        assignField(key, value);
                     }
                 }
-            });
+            }
             
             // Strategy 4: Enhanced UNSPSC extraction
-            var unspscPatterns = [
-                /UNSPSC[:\\s]+([0-9]{8,12})/gi,
-                /UNSPC[:\\s]+([0-9]{8,12})/gi,
-                /unspsc code[:\\s]+([0-9]{8,12})/gi,
-                /classification[:\\s]+([0-9]{8,12})/gi
-            ];
-            
-            var pageText = document.body.textContent || document.body.innerText || '';
-            unspscPatterns.forEach(pattern => {
-                if (!info.unspsc) {
-                    var matches = pageText.match(pattern);
-                    if (matches && matches[0]) {
-                        var code = matches[0].replace(/[^0-9]/g, '');
-                        if (code.length >= 8) {
-                            info.unspsc = code;
-                        }
-                    }
+            if (!info.unspsc && needed.indexOf('unspsc') >= 0) {
+                var pageText = document.body.textContent || document.body.innerText || '';
+                var unspsc = pageText.match(/(?:unspsc code|unspsc|unspc|classification)[:\\s]+([0-9]{8,12})/i);
+                if (unspsc) {
+                    info.unspsc = unspsc[1];
                 }
-            });
+            }
             
             return extractInfo();
             """
             
-            # Execute JavaScript extraction
+            # Execute JavaScript extraction for the fields still missing
+            needed_fields = [field for field in INFO_FIELDS if not product_data.get(field)]
             try:
-                js_info = self.driver.execute_script(js_script)
+                js_info = self.driver.execute_script(js_script, needed_fields) if needed_fields else None
                 if js_info:
                     # Map JavaScript results to product_data with validation
-                    for field in ['brand', 'supplier', 'manufactured_country', 'sku', 'model', 'unspsc', 'category', 'main_category']:
-                        if field in js_info and js_info[field]:
-                            value = str(js_info[field]).strip()
-                            # Additional validation
-                            if (value and len(value) > 0 and 
-                                value != '/ Item Code:' and 
-                                value != '/ Serial Number:' and
-                                not (value.startswith('/') and len(value) < 5)):
-                                product_data[field] = value
+                    values = {field: str(value).strip() for field, value in js_info.items()
+                              if field in _ALLOWED_FIELDS and value}
+                    product_data.update({
+                        field: value for field, value in values.items()
+                        if (_is_valid_value(value) if field in ('sku', 'model')
+                            else value and not (value.startswith('/') and len(value) < 5))
+                    })
                     
                     self.logger.info(f"   JavaScript extracted {len([k for k in js_info.keys() if js_info[k]])} info fields")
                     
             except Exception as e:
                 self.logger.debug(f"JavaScript info extraction failed: {e}")
             
-            # Enhanced regex extraction with better patterns
-            import re
-            patterns = [
-                # Less strict patterns for brand and supplier
-                (r'Brand[:\s]+([^<\n]+?)(?=\s*(?:Supplier|Category|$|\n))', 'brand'),
-                (r'Supplier[:\s]+([^<\n]+?)(?=\s*(?:Brand|Category|$|\n))', 'supplier'),
-                (r'(?:Manufactured Country|Manufacturing Country|Origin Country|Country)[:\s]+([^<\n,/]+?)(?=\s*(?:Brand|Supplier|$|\n))', 'manufactured_country'),
-                # Improved SKU pattern - avoid placeholder text
-                (r'(?:SKU|Item Code|Product Code|Part Number)[:\s]+([A-Za-z0-9\-_\.]+)(?:\s|$)', 'sku'),
-                # Improved Model pattern - avoid placeholder text  
-                (r'(?:Model|Serial Number|Model Number)[:\s]+([A-Za-z0-9\-_\s\.]+?)(?=\s*(?:Brand|Supplier|$|\n))', 'model'),
-                # Enhanced UNSPSC pattern
-                (r'(?:UNSPSC|UNSPC)[:\s]+([0-9]{8,12})', 'unspsc'),
-                (r'Category[:\s]+([^<\n,/]+?)(?=\s*(?:Brand|Supplier|$|\n))', 'category'),
-                (r'Main Category[:\s]+([^<\n,/]+?)(?=\s*(?:Brand|Supplier|$|\n))', 'main_category')
-            ]
-            
-            for pattern, key in patterns:
-                if not product_data.get(key):
-                    matches = re.findall(pattern, page_text, re.IGNORECASE | re.MULTILINE)
-                    if matches:
-                        value = matches[0].strip()
+            # Enhanced regex extraction - one pass over the page, stopping once every field is filled
+            needed = {field for field in INFO_FIELDS if not product_data.get(field)}
+            if needed:
+                for match in INFO_RE.finditer(page_text):
+                    key = match.lastgroup
+                    if key in needed:
+                        value = match.group(key).strip()
                         
                         # Different validation for different field types
                         is_valid = True
@@ -715,10 +1366,7 @@ class FixedSearchExtractor:
                         
                         # Strict validation only for SKU and Model fields
                         elif key in ['sku', 'model']:
-                            if (value in ['/ Item Code:', '/ Serial Number:', 'Item Code:', 'Serial Number:'] or
-                                value.startswith('/') or value.startswith('{') or
-                                any(skip in value for skip in ['Feature', 'Value', 'Item Code:', 'Serial Number:'])):
-                                is_valid = False
+                            is_valid = _is_valid_value(value)
                         
                         # Less strict validation for brand and supplier
                         elif key in ['brand', 'supplier']:
@@ -727,6 +1375,9 @@ class FixedSearchExtractor:
                         
                         if is_valid:
                             product_data[key] = value
+                            needed.discard(key)
+                            if not needed:
+                                break
             
             # Clean up extracted data to remove duplicates and invalid entries
             self._clean_extracted_data(product_data)
@@ -757,7 +1408,7 @@ class FixedSearchExtractor:
             
             # Log extraction results
             extracted_fields = []
-            for field in ['brand', 'supplier', 'manufactured_country', 'sku', 'model', 'unspsc', 'category', 'main_category']:
+            for field in INFO_FIELDS:
                 if product_data.get(field):
                     extracted_fields.append(f"{field}: {product_data[field]}")
             
@@ -778,117 +1429,58 @@ class FixedSearchExtractor:
                 return
             
             # Look for SKU and Model in the product details section
-            detail_selectors = [
-                ".product-details",
-                ".product-info", 
-                ".item-details",
-                ".specifications",
-                ".product-specs",
-                "[class*='detail']",
-                "[class*='spec']",
-                ".product-attributes",
-                ".product-features",
-                ".item-info",
-                ".product-data"
-            ]
-            
-            for selector in detail_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        text = element.text
-                        
-                        # Look for SKU patterns
-                        if not product_data.get('sku') or product_data['sku'] in ['/ Item Code:', 'Item Code:']:
-                            sku_patterns = [
-                                r'Item Code[:\s]+([A-Za-z0-9\-_\.]+)',
-                                r'SKU[:\s]+([A-Za-z0-9\-_\.]+)',
-                                r'Product Code[:\s]+([A-Za-z0-9\-_\.]+)',
-                                r'Part Number[:\s]+([A-Za-z0-9\-_\.]+)'
-                            ]
-                            
-                            import re
-                            for pattern in sku_patterns:
-                                matches = re.findall(pattern, text, re.IGNORECASE)
-                                if matches:
-                                    sku_value = matches[0].strip()
-                                    if (sku_value and len(sku_value) > 0 and 
-                                        sku_value not in ['/ Item Code:', 'Item Code:', '/', '{'] and
-                                        not sku_value.startswith('/')):
-                                        product_data['sku'] = sku_value
-                                        self.logger.info(f"   Found SKU: {sku_value}")
-                                        break
-                        
-                        # Look for Model patterns
-                        if not product_data.get('model') or product_data['model'] in ['/ Serial Number:', 'Serial Number:']:
-                            model_patterns = [
-                                r'Serial Number[:\s]+([A-Za-z0-9\-_\s\.]+)',
-                                r'Model[:\s]+([A-Za-z0-9\-_\s\.]+)',
-                                r'Model Number[:\s]+([A-Za-z0-9\-_\s\.]+)'
-                            ]
-                            
-                            for pattern in model_patterns:
-                                matches = re.findall(pattern, text, re.IGNORECASE)
-                                if matches:
-                                    model_value = matches[0].strip()
-                                    if (model_value and len(model_value) > 0 and 
-                                        model_value not in ['/ Serial Number:', 'Serial Number:', '/', '{'] and
-                                        not model_value.startswith('/')):
-                                        product_data['model'] = model_value
-                                        self.logger.info(f"   Found Model: {model_value}")
-                                        break
-                        
-                        # If we found both, we can stop
-                        if (product_data.get('sku') and product_data['sku'] not in ['/ Item Code:', 'Item Code:'] and
-                            product_data.get('model') and product_data['model'] not in ['/ Serial Number:', 'Serial Number:']):
-                            return
-                            
-                except Exception as e:
-                    self.logger.debug(f"Detail selector failed {selector}: {e}")
-                    continue
+            for text in self._selector_texts(DETAIL_SELECTORS) or []:
+                # Look for SKU patterns
+                if not product_data.get('sku') or product_data['sku'] in ['/ Item Code:', 'Item Code:']:
+                    for pattern in DETAIL_SKU_PATTERNS:
+                        matches = pattern.findall(text)
+                        if matches:
+                            sku_value = matches[0].strip()
+                            if _is_valid_value(sku_value):
+                                product_data['sku'] = sku_value
+                                self.logger.info(f"   Found SKU: {sku_value}")
+                                break
+                
+                # Look for Model patterns
+                if not product_data.get('model') or product_data['model'] in ['/ Serial Number:', 'Serial Number:']:
+                    for pattern in DETAIL_MODEL_PATTERNS:
+                        matches = pattern.findall(text)
+                        if matches:
+                            model_value = matches[0].strip()
+                            if _is_valid_value(model_value):
+                                product_data['model'] = model_value
+                                self.logger.info(f"   Found Model: {model_value}")
+                                break
+                
+                # If we found both, we can stop
+                if (product_data.get('sku') and product_data['sku'] not in ['/ Item Code:', 'Item Code:'] and
+                    product_data.get('model') and product_data['model'] not in ['/ Serial Number:', 'Serial Number:']):
+                    return
             
             # Fallback: Look in the entire page for better patterns
             if (not product_data.get('sku') or product_data['sku'] in ['/ Item Code:', 'Item Code:'] or
                 not product_data.get('model') or product_data['model'] in ['/ Serial Number:', 'Serial Number:']):
                 
-                page_text = self.driver.page_source
+                page_text = self._page_source()
                 
                 # Enhanced SKU extraction
                 if not product_data.get('sku') or product_data['sku'] in ['/ Item Code:', 'Item Code:']:
-                    enhanced_sku_patterns = [
-                        r'Item Code[:\s]*([A-Za-z0-9\-_\.]+)(?:\s|$|</)',
-                        r'SKU[:\s]*([A-Za-z0-9\-_\.]+)(?:\s|$|</)',
-                        r'Product Code[:\s]*([A-Za-z0-9\-_\.]+)(?:\s|$|</)',
-                        r'Part Number[:\s]*([A-Za-z0-9\-_\.]+)(?:\s|$|</)'
-                    ]
-                    
-                    import re
-                    for pattern in enhanced_sku_patterns:
-                        matches = re.findall(pattern, page_text, re.IGNORECASE)
+                    for pattern in PAGE_SKU_PATTERNS:
+                        matches = pattern.findall(page_text)
                         if matches:
                             sku_value = matches[0].strip()
-                            if (sku_value and len(sku_value) > 0 and 
-                                sku_value not in ['/ Item Code:', 'Item Code:', '/', '{', 'Feature', 'Value'] and
-                                not sku_value.startswith('/')):
+                            if _is_valid_value(sku_value):
                                 product_data['sku'] = sku_value
                                 self.logger.info(f"   Found SKU (fallback): {sku_value}")
                                 break
                 
                 # Enhanced Model extraction
                 if not product_data.get('model') or product_data['model'] in ['/ Serial Number:', 'Serial Number:']:
-                    enhanced_model_patterns = [
-                        r'Serial Number[:\s]*([A-Za-z0-9\-_\s\.]+)(?:\s|$|</)',
-                        r'Model[:\s]*([A-Za-z0-9\-_\s\.]+)(?:\s|$|</)',
-                        r'Model Number[:\s]*([A-Za-z0-9\-_\s\.]+)(?:\s|$|</)'
-                    ]
-                    
-                    for pattern in enhanced_model_patterns:
-                        matches = re.findall(pattern, page_text, re.IGNORECASE)
+                    for pattern in PAGE_MODEL_PATTERNS:
+                        matches = pattern.findall(page_text)
                         if matches:
                             model_value = matches[0].strip()
-                            if (model_value and len(model_value) > 0 and 
-                                model_value not in ['/ Serial Number:', 'Serial Number:', '/', '{', 'Feature', 'Value'] and
-                                not model_value.startswith('/')):
+                            if _is_valid_value(model_value):
                                 product_data['model'] = model_value
                                 self.logger.info(f"   Found Model (fallback): {model_value}")
                                 break
@@ -903,68 +1495,31 @@ class FixedSearchExtractor:
             if 'key_attributes' in product_data and product_data['key_attributes']:
                 attributes = product_data['key_attributes']
                 
-                # Look for Brand in key attributes
-                if not product_data.get('brand'):
-                    brand_keys = ['Brand', 'Manufacturer', 'Make']
-                    for key in brand_keys:
-                        if key in attributes:
-                            value = attributes[key]
-                            if (value and value not in ['Feature', 'Value', '{'] and
-                                not value.startswith('/') and len(value) > 0):
-                                product_data['brand'] = value
-                                self.logger.info(f"   Found Brand in key attributes: {value}")
-                                break
-                
-                # Look for Supplier in key attributes
-                if not product_data.get('supplier'):
-                    supplier_keys = ['Supplier', 'Vendor', 'Distributor']
-                    for key in supplier_keys:
-                        if key in attributes:
-                            value = attributes[key]
-                            if (value and value not in ['Feature', 'Value', '{'] and
-                                not value.startswith('/') and len(value) > 0):
-                                product_data['supplier'] = value
-                                self.logger.info(f"   Found Supplier in key attributes: {value}")
-                                break
-                
-                # Look for SKU in key attributes
-                if not product_data.get('sku') or product_data['sku'] in ['/ Item Code:', 'Item Code:', '']:
-                    sku_keys = ['SKU', 'Item Code', 'Product Code', 'Part Number', 'Code']
-                    for key in sku_keys:
-                        if key in attributes:
-                            value = attributes[key]
-                            if (value and value not in ['/ Item Code:', 'Item Code:', 'Feature', 'Value', '{'] and
-                                not value.startswith('/') and len(value) > 0):
-                                product_data['sku'] = value
-                                self.logger.info(f"   Found SKU in key attributes: {value}")
-                                break
-                
-                # Look for Model in key attributes
-                if not product_data.get('model') or product_data['model'] in ['/ Serial Number:', 'Serial Number:', '']:
-                    model_keys = ['Model', 'Serial Number', 'Model Number', 'Serial']
-                    for key in model_keys:
-                        if key in attributes:
-                            value = attributes[key]
-                            if (value and value not in ['/ Serial Number:', 'Serial Number:', 'Feature', 'Value', '{'] and
-                                not value.startswith('/') and len(value) > 0):
-                                product_data['model'] = value
-                                self.logger.info(f"   Found Model in key attributes: {value}")
-                                break
+                # One pass over the attributes, keeping the best-priority valid value per field
+                found = {}
+                for label, value in attributes.items():
+                    field, priority = _ALIAS_MAP.get(label, (None, None))
+                    if field is None or (field in found and found[field][0] < priority):
+                        continue
+                    
+                    if field == 'unspsc':
+                        # Clean the value to get just numbers
+                        numbers = _DIGITS_RE.findall(str(value)) if value and len(str(value)) >= 8 else []
+                        value = numbers[0] if numbers and len(numbers[0]) >= 8 else None
+                    elif field in ('sku', 'model'):
+                        value = value if _is_valid_value(value) else None
+                    elif not value or value in ['Feature', 'Value', '{'] or value.startswith('/'):
+                        value = None
+                    
+                    if value:
+                        found[field] = (priority, value)
                 
-                # Look for UNSPSC in key attributes
-                if not product_data.get('unspsc'):
-                    unspsc_keys = ['UNSPSC', 'UNSPC', 'Classification']
-                    for key in unspsc_keys:
-                        if key in attributes:
-                            value = attributes[key]
-                            if value and len(str(value)) >= 8:
-                                # Clean the value to get just numbers
-                                import re
-                                numbers = re.findall(r'[0-9]+', str(value))
-                                if numbers and len(numbers[0]) >= 8:
-                                    product_data['unspsc'] = numbers[0]
-                                    self.logger.info(f"   Found UNSPSC in key attributes: {numbers[0]}")
-                                    break
+                for field, (_, value) in found.items():
+                    # SKU/Model may still hold placeholder text from the page
+                    if (not product_data.get(field) or
+                        product_data[field] in ['/ Item Code:', 'Item Code:', '/ Serial Number:', 'Serial Number:']):
+                        product_data[field] = value
+                        self.logger.info(f"   Found {field} in key attributes: {value}")
                                     
         except Exception as e:
             self.logger.debug(f"Error extracting from key attributes: {e}")
@@ -975,43 +1530,17 @@ class FixedSearchExtractor:
             self.logger.info("🔍 DEBUG: Looking for actual SKU and Model values...")
             
             # Get the page source and look for patterns
-            page_source = self.driver.page_source
+            page_source = self._page_source()
             
             # Look for patterns that might contain the actual values
-            import re
-            
-            # Look for any text that looks like a product code or model number
-            # Common patterns: alphanumeric codes, numbers with letters, etc.
-            
-            # Pattern 1: Look for codes like "838007" (from the description)
-            number_patterns = re.findall(r'\b([A-Za-z0-9]{6,10})\b', page_source)
-            
-            # Pattern 2: Look for specific patterns in the HTML
-            sku_patterns = [
-                r'Item Code[:\s]*([A-Za-z0-9\-_\.]+)',
-                r'SKU[:\s]*([A-Za-z0-9\-_\.]+)',
-                r'Product Code[:\s]*([A-Za-z0-9\-_\.]+)',
-                r'Code[:\s]*([A-Za-z0-9\-_\.]+)',
-                r'([A-Za-z0-9]{6,10})(?:\s|$|</)'
-            ]
-            
-            model_patterns = [
-                r'Serial Number[:\s]*([A-Za-z0-9\-_\s\.]+)',
-                r'Model[:\s]*([A-Za-z0-9\-_\s\.]+)',
-                r'Model Number[:\s]*([A-Za-z0-9\-_\s\.]+)',
-                r'Serial[:\s]*([A-Za-z0-9\-_\s\.]+)'
-            ]
             
             # Try to find SKU
             if not product_data.get('sku') or product_data['sku'] in ['/ Item Code:', 'Item Code:', '']:
-                for pattern in sku_patterns:
-                    matches = re.findall(pattern, page_source, re.IGNORECASE)
+                for pattern in DEBUG_SKU_PATTERNS:
+                    matches = pattern.findall(page_source)
                     for match in matches:
-                        if (match and len(match) >= 3 and 
-                            match not in ['/ Item Code:', 'Item Code:', 'Feature', 'Value', '{'] and
-                            not match.startswith('/') and
-                            not match.startswith('{') and
-                            match.isalnum()):  # Only alphanumeric
+                        if (len(match) >= 3 and match.isalnum() and  # Only alphanumeric
+                            _is_valid_value(match)):
                             product_data['sku'] = match
                             self.logger.info(f"   DEBUG: Found potential SKU: {match}")
                             break
@@ -1020,14 +1549,11 @@ class FixedSearchExtractor:
             
             # Try to find Model
             if not product_data.get('model') or product_data['model'] in ['/ Serial Number:', 'Serial Number:', '']:
-                for pattern in model_patterns:
-                    matches = re.findall(pattern, page_source, re.IGNORECASE)
+                for pattern in DEBUG_MODEL_PATTERNS:
+                    matches = pattern.findall(page_source)
                     for match in matches:
-                        if (match and len(match) >= 3 and 
-                            match not in ['/ Serial Number:', 'Serial Number:', 'Feature', 'Value', '{'] and
-                            not match.startswith('/') and
-                            not match.startswith('{') and
-                            match.isalnum()):  # Only alphanumeric
+                        if (len(match) >= 3 and match.isalnum() and  # Only alphanumeric
+                            _is_valid_value(match)):
                             product_data['model'] = match
                             self.logger.info(f"   DEBUG: Found potential Model: {match}")
                             break
@@ -1039,12 +1565,10 @@ class FixedSearchExtractor:
                 not product_data.get('model') or product_data['model'] in ['/ Serial Number:', 'Serial Number:', '']):
                 
                 # Look for codes in the format like "838007" from the description
-                potential_codes = re.findall(r'\b([A-Za-z0-9]{6,10})\b', page_source)
+                potential_codes = _PRODUCT_CODE_RE.findall(page_source)
                 
                 for code in potential_codes:
-                    if (code and code.isalnum() and len(code) >= 6 and
-                        code not in ['/ Item Code:', 'Item Code:', '/ Serial Number:', 'Serial Number:', 'Feature', 'Value', '{'] and
-                        not code.startswith('/') and not code.startswith('{')):
+                    if code.isalnum() and len(code) >= 6 and _is_valid_value(code):
                         
                         # If we don't have SKU, use this as SKU
                         if not product_data.get('sku') or product_data['sku'] in ['/ Item Code:', 'Item Code:', '']:
@@ -1063,21 +1587,12 @@ class FixedSearchExtractor:
     def _extract_brand_supplier_fallback(self, product_data):
         """Fallback method to extract brand and supplier from page source"""
         try:
-            page_source = self.driver.page_source
+            page_source = self._page_source()
             
             # Look for brand patterns
             if not product_data.get('brand'):
-                brand_patterns = [
-                    r'Brand[:\s]+([^<\n,]+)',
-                    r'Manufacturer[:\s]+([^<\n,]+)',
-                    r'Make[:\s]+([^<\n,]+)',
-                    r'Tenby',  # Known brand from the data
-                    r'Brand[:\s]*([A-Za-z\s]+)'
-                ]
-                
-                import re
-                for pattern in brand_patterns:
-                    matches = re.findall(pattern, page_source, re.IGNORECASE)
+                for pattern in FALLBACK_BRAND_PATTERNS:
+                    matches = pattern.findall(page_source)
                     if matches:
                         brand = matches[0].strip()
                         if (brand and len(brand) > 0 and len(brand) < 100 and
@@ -1089,17 +1604,8 @@ class FixedSearchExtractor:
             
             # Look for supplier patterns
             if not product_data.get('supplier'):
-                supplier_patterns = [
-                    r'Supplier[:\s]+([^<\n,]+)',
-                    r'Vendor[:\s]+([^<\n,]+)',
-                    r'Distributor[:\s]+([^<\n,]+)',
-                    r'Sold by[:\s]+([^<\n,]+)',
-                    r'Khalid and Naeem Trading',  # Known supplier from the data
-                    r'Supplier[:\s]*([A-Za-z\s]+)'
-                ]
-                
-                for pattern in supplier_patterns:
-                    matches = re.findall(pattern, page_source, re.IGNORECASE)
+                for pattern in FALLBACK_SUPPLIER_PATTERNS:
+                    matches = pattern.findall(page_source)
                     if matches:
                         supplier = matches[0].strip()
                         if (supplier and len(supplier) > 0 and len(supplier) < 200 and
@@ -1360,12 +1866,10 @@ class FixedSearchExtractor:
                 self.logger.debug(f"JavaScript category extraction failed: {e}")
             
             # Fallback: Look for the specific text pattern in the page
-            page_source = self.driver.page_source
+            page_source = self._page_source()
             
             # First, try to find the exact complete category text
-            import re
-            exact_category_pattern = r'<span[^>]*title="([^"]*Electrical switches and accessories[^"]*)"[^>]*>'
-            exact_matches = re.findall(exact_category_pattern, page_source, re.IGNORECASE | re.DOTALL)
+            exact_matches = _EXACT_CATEGORY_RE.findall(page_source)
             if exact_matches:
                 for match in exact_matches:
                     category = match.strip()
@@ -1383,30 +1887,15 @@ class FixedSearchExtractor:
             if product_data.get('unspsc'):
                 return  # Already found
             
-            page_text = self.driver.page_source
+            page_text = self._page_source()
             
             # Comprehensive UNSPSC patterns
-            unspsc_patterns = [
-                r'UNSPSC[:\s]*([0-9]{8,12})',
-                r'UNSPC[:\s]*([0-9]{8,12})',
-                r'unspsc code[:\s]*([0-9]{8,12})',
-                r'unspc code[:\s]*([0-9]{8,12})',
-                r'classification[:\s]*([0-9]{8,12})',
-                r'UNSPSC[:\s]*([0-9]{4,4}-[0-9]{2,2}-[0-9]{2,2})',
-                r'UNSPC[:\s]*([0-9]{4,4}-[0-9]{2,2}-[0-9]{2,2})',
-                # Look for 8-12 digit numbers that might be UNSPSC
-                r'([0-9]{8,12})(?:\s|$|</)',
-                # Look for 4-2-2 format
-                r'([0-9]{4,4}-[0-9]{2,2}-[0-9]{2,2})(?:\s|$|</)'
-            ]
-            
-            import re
-            for pattern in unspsc_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
+            for pattern in UNSPSC_PATTERNS:
+                matches = pattern.findall(page_text)
                 if matches:
                     for match in matches:
                         # Clean the match
-                        code = re.sub(r'[^0-9\-]', '', str(match))
+                        code = _NON_CODE_CHARS_RE.sub('', str(match))
                         
                         # Validate UNSPSC format
                         if (len(code) >= 8 and 
@@ -1435,7 +1924,7 @@ class FixedSearchExtractor:
                     for element in elements:
                         text = element.text
                         # Look for 8-12 digit numbers
-                        numbers = re.findall(r'[0-9]{8,12}', text)
+                        numbers = _UNSPSC_DIGITS_RE.findall(text)
                         if numbers:
                             code = numbers[0]
                             if len(code) >= 8:
@@ -1452,34 +1941,12 @@ class FixedSearchExtractor:
     def _clean_extracted_data(self, product_data):
         """Clean up extracted data to remove invalid entries and duplicates"""
         try:
-            # Fields to clean
-            fields_to_clean = ['brand', 'supplier', 'manufactured_country', 'sku', 'model', 'unspsc', 'category', 'main_category']
-            
-            for field in fields_to_clean:
+            for field in INFO_FIELDS:
                 if field in product_data and product_data[field]:
                     value = str(product_data[field]).strip()
                     
-                    # Remove invalid values
-                    invalid_patterns = [
-                        '/ Item Code:',
-                        '/ Serial Number:',
-                        'Item Code:',
-                        'Serial Number:',
-                        'Feature',
-                        'Value',
-                        '{',
-                        '}',
-                        '/68453e3dce9b0a422ee865ac">',
-                        'Feature:',
-                        'Value:'
-                    ]
-                    
                     # Check if value is invalid
-                    is_invalid = False
-                    for pattern in invalid_patterns:
-                        if pattern in value:
-                            is_invalid = True
-                            break
+                    is_invalid = any(pattern in value for pattern in _INVALID_SUBSTRINGS)
                     
                     # Additional validation - less strict for brand and supplier
                     if is_invalid:
@@ -1495,10 +1962,9 @@ class FixedSearchExtractor:
                     else:
                         # Clean up the value
                         # Remove HTML-like content
-                        import re
-                        cleaned_value = re.sub(r'<[^>]+>', '', value)
+                        cleaned_value = _HTML_TAG_RE.sub('', value)
                         # Remove excessive whitespace
-                        cleaned_value = re.sub(r'\s+', ' ', cleaned_value).strip()
+                        cleaned_value = _WHITESPACE_RE.sub(' ', cleaned_value).strip()
                         # Remove trailing dots if too many
                         if cleaned_value.endswith('...') and len(cleaned_value) > 20:
                             cleaned_value = cleaned_value[:-3].strip()
@@ -1531,7 +1997,7 @@ class FixedSearchExtractor:
             self.logger.info("🔍 DEBUGGING PAGE CONTENT:")
             
             # Check page source for search keywords
-            page_source = self.driver.page_source.lower()
+            page_source = self._page_source_lower()
             search_keywords = self._extract_search_keywords(search_term)
             
             for keyword in search_keywords:
@@ -1585,6 +2051,7 @@ class FixedSearchExtractor:
             
             # Navigate to product page
             self.driver.get(url)
+            self._invalidate_page_source()
             time.sleep(5)
             
             # Initialize product data
@@ -1641,15 +2108,8 @@ class FixedSearchExtractor:
         """Extract brand and supplier information dynamically"""
         try:
             # Common brand patterns to look for
-            brand_patterns = [
-                r'brand[:\s]+([^<\n,]+)',
-                r'manufacturer[:\s]+([^<\n,]+)',
-                r'make[:\s]+([^<\n,]+)'
-            ]
-            
-            import re
-            for pattern in brand_patterns:
-                matches = re.findall(pattern, page_source, re.IGNORECASE)
+            for pattern in BRAND_PATTERNS:
+                matches = pattern.findall(page_source)
                 if matches:
                     brand = matches[0].strip()
                     if brand and len(brand) < 50:  # Reasonable brand name length
@@ -1657,15 +2117,8 @@ class FixedSearchExtractor:
                         break
             
             # Common supplier patterns
-            supplier_patterns = [
-                r'supplier[:\s]+([^<\n,]+)',
-                r'sold by[:\s]+([^<\n,]+)',
-                r'vendor[:\s]+([^<\n,]+)',
-                r'distributed by[:\s]+([^<\n,]+)'
-            ]
-            
-            for pattern in supplier_patterns:
-                matches = re.findall(pattern, page_source, re.IGNORECASE)
+            for pattern in SUPPLIER_PATTERNS:
+                matches = pattern.findall(page_source)
                 if matches:
                     supplier = matches[0].strip()
                     if supplier and len(supplier) < 100:  # Reasonable supplier name length
@@ -1799,29 +2252,11 @@ class FixedSearchExtractor:
             
             # Strategy 4: Extract from page source patterns
             self.logger.info("   Analyzing page source for specifications...")
-            page_source = self.driver.page_source
+            page_source = self._page_source()
             
             # Common specification patterns
-            spec_patterns = [
-                (r'Material[:\s]*([^<\n]+)', 'Material'),
-                (r'Color[:\s]*([^<\n]+)', 'Color'),
-                (r'Voltage[:\s]*([^<\n]+)', 'Voltage'),
-                (r'Current[:\s]*([^<\n]+)', 'Current'),
-                (r'Rating[:\s]*([^<\n]+)', 'Rating'),
-                (r'Standard[:\s]*([^<\n]+)', 'Standard'),
-                (r'Gang[:\s]*([^<\n]+)', 'Gang'),
-                (r'Mounting[:\s]*([^<\n]+)', 'Mounting'),
-                (r'Finish[:\s]*([^<\n]+)', 'Finish'),
-                (r'Type[:\s]*([^<\n]+)', 'Type'),
-                (r'Brand[:\s]*([^<\n]+)', 'Brand'),
-                (r'Model[:\s]*([^<\n]+)', 'Model'),
-                (r'UNSPSC[:\s]*([^<\n]+)', 'UNSPSC'),
-                (r'Category[:\s]*([^<\n]+)', 'Category')
-            ]
-            
-            import re
-            for pattern, key in spec_patterns:
-                matches = re.findall(pattern, page_source, re.IGNORECASE)
+            for pattern, key in SPEC_PATTERNS:
+                matches = pattern.findall(page_source)
                 if matches:
                     value = matches[0].strip()
                     if self._is_valid_attribute(key, value):
@@ -1997,11 +2432,11 @@ class FixedSearchExtractor:
                             continue
                         elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                     
-                    for element in elements:
+                    for element, visible, enabled, tag, href, text in self._inspect_elements(elements):
                         try:
                             # Check if element is clickable and visible
-                            if element.is_displayed() and element.is_enabled():
-                                self.logger.info(f"   Found clickable element: {element.text[:50]}...")
+                            if visible and enabled:
+                                self.logger.info(f"   Found clickable element: {text[:50]}...")
                                 
                                 # Scroll to element
                                 self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
@@ -2014,6 +2449,7 @@ class FixedSearchExtractor:
                                     # Fallback to JavaScript click
                                     self.driver.execute_script("arguments[0].click();", element)
                                 
+                                self._invalidate_page_source()
                                 time.sleep(2)  # Wait for content to load
                                 description_clicked = True
                                 self.logger.info("   ✅ Successfully clicked Product Description tab")
@@ -2258,22 +2694,25 @@ class FixedSearchExtractor:
             if not image_url.startswith('http'):
                 image_url = urljoin(self.base_url, image_url)
             
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
-            
             # Generate filename
             import hashlib
             url_hash = hashlib.md5(image_url.encode()).hexdigest()[:8]
             filename = f"product_image_{url_hash}.jpg"
             
-            # Save image
-            with open(filename, 'wb') as f:
-                f.write(response.content)
+            # Stream the image to disk instead of holding the whole body in memory
+            size_bytes = 0
+            self._sync_http_cookies()
+            with self.http.get(image_url, timeout=(3, 10), stream=True) as response:
+                response.raise_for_status()
+                with open(filename, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+                        size_bytes += len(chunk)
             
             return {
                 'filename': filename,
                 'url': image_url,
-                'size_bytes': len(response.content)
+                'size_bytes': size_bytes
             }
             
         except Exception as e:
@@ -2286,8 +2725,9 @@ class FixedSearchExtractor:
         try:
             # Check if we're in cloud-first mode
             try:
-                from gcs_config import USE_GCS, EXTRACTION_CONFIG
-                cloud_first_mode = USE_GCS and EXTRACTION_CONFIG.get("cloud_first_mode", False)
+                from gcs_config import load_gcs_config
+                gcs_settings = load_gcs_config()
+                cloud_first_mode = gcs_settings["USE_GCS"] and gcs_settings["EXTRACTION_CONFIG"].get("cloud_first_mode", False)
                 
                 if cloud_first_mode:
                     self.logger.info("🌩️ Cloud-first mode: Skipping local file save - data will be saved to GCS by main extractor")
@@ -2433,15 +2873,20 @@ class FixedSearchExtractor:
             
         except Exception as e:
             print(f"❌ Workflow failed: {e}")
+            self._workflow_failed = True
             return None
     
-    def close(self):
-        """Close the WebDriver"""
+    def close(self, discard=False):
+        """Return the WebDriver to the pool (or quit it after a failure) and close the HTTP session"""
         try:
             if hasattr(self, 'driver') and self.driver:
-                self.driver.quit()
+                _DRIVER_POOL.release(self._pool_key, self.driver, discard=discard or self._workflow_failed)
+                self.driver = None
         except Exception as e:
-            self.logger.warning(f"Error closing WebDriver: {e}")
+            self.logger.warning(f"Error releasing WebDriver: {e}")
+        
+        if hasattr(self, 'http'):
+            self.http.close()
 
 def main():
     """Main function to run the fixed extraction tool"""
@@ -1,41 +1,70 @@
 #!/usr/bin/env python3
 """
 Google Cloud Storage Configuration
-Updated via Streamlit UI - 2025-07-30 16:15:03
+Values are read from gcs_config.json (written by the Streamlit UI)
 Cloud-First Architecture: Google Cloud Storage Only
 """
 
-# GCS Configuration - Always enabled for cloud-first mode
-USE_GCS = True
-GCS_BUCKET_NAME = "scraped-data-bucket-hts-big-traderz"
-GCS_DATA_FOLDER = "data"
+import os
+import json
+import copy
 
-# Extraction Configuration
-EXTRACTION_CONFIG = {
-    "headless_mode": True,
-    "delay_between_products": 3,
-    "max_parallel_extractions": 3,
-    "max_retries": 3,
-    "confidence_threshold": 50.0,
-    "cloud_first_mode": True
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gcs_config.json")
+
+# Defaults used when gcs_config.json has not been written yet
+DEFAULT_CONFIG = {
+    "USE_GCS": True,
+    "GCS_BUCKET_NAME": "scraped-data-bucket-hts-big-traderz",
+    "GCS_DATA_FOLDER": "data",
+    "EXTRACTION_CONFIG": {
+        "headless_mode": True,
+        "delay_between_products": 3,
+        "max_parallel_extractions": 3,
+        "max_retries": 3,
+        "confidence_threshold": 50.0,
+        "cloud_first_mode": True
+    }
 }
 
-def validate_gcs_config():
+def load_gcs_config():
+    """Load the current configuration from gcs_config.json, falling back to defaults"""
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    try:
+        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return config
+    
+    config.update({key: value for key, value in saved.items() if key != "EXTRACTION_CONFIG"})
+    config["EXTRACTION_CONFIG"].update(saved.get("EXTRACTION_CONFIG", {}))
+    return config
+
+# GCS Configuration - snapshot taken at import time
+# (call load_gcs_config() to pick up changes made after import)
+_config = load_gcs_config()
+USE_GCS = _config["USE_GCS"]
+GCS_BUCKET_NAME = _config["GCS_BUCKET_NAME"]
+GCS_DATA_FOLDER = _config["GCS_DATA_FOLDER"]
+EXTRACTION_CONFIG = _config["EXTRACTION_CONFIG"]
+
+def validate_gcs_config(config=None):
     """Validate GCS configuration"""
-    if USE_GCS:
-        if GCS_BUCKET_NAME == "scraped-data-bucket-hts-big-traderz":
-            print("Please update GCS_BUCKET_NAME in gcs_config.py with your actual bucket name")
+    config = config or load_gcs_config()
+    bucket_name = config["GCS_BUCKET_NAME"]
+    if config["USE_GCS"]:
+        if bucket_name == "your-bucket-name":
+            print("Please update GCS_BUCKET_NAME in gcs_config.json with your actual bucket name")
             return False
         
         try:
             from google.cloud import storage
             client = storage.Client()
-            bucket = client.bucket(GCS_BUCKET_NAME)
+            bucket = client.bucket(bucket_name)
             if not bucket.exists():
-                print(f"GCS bucket '{GCS_BUCKET_NAME}' does not exist!")
+                print(f"GCS bucket '{bucket_name}' does not exist!")
                 print("Please create the bucket or update GCS_BUCKET_NAME.")
                 return False
-            print(f"GCS bucket '{GCS_BUCKET_NAME}' is accessible")
+            print(f"GCS bucket '{bucket_name}' is accessible")
             return True
         except Exception as e:
             print(f"GCS validation failed: {e}")
@@ -45,4 +74,3 @@ def validate_gcs_config():
 def print_setup_instructions():
     """Print GCS setup instructions"""
     pass
-
@@ -181,7 +181,7 @@ class GCSManager:
                 df.to_excel(writer, sheet_name=sheet_name, index=False)
             excel_buffer.seek(0)
             
-            self.logger.info(f"💾 Excel file created in memory, size: {len(excel_buffer.getvalue())} bytes")
+            self.logger.info(f"💾 Excel file created in memory, size: {excel_buffer.getbuffer().nbytes} bytes")
             
             # Upload to GCS
             blob = self.bucket.blob(gcs_file_path)
@@ -367,6 +367,7 @@ class ProductExtractionAgent:
                              gcs_manager: Optional["GCSManager"] = None) -> ExtractionResult:
         """Extract details for a single product with enhanced error handling and cloud-first approach"""
         extractor = None
+        failed = False
         start_time = time.time()
         
         try:
@@ -472,6 +473,7 @@ class ProductExtractionAgent:
                 )
                 
         except Exception as e:
+            failed = True
             self.logger.error(f"❌ Error extracting details for {product.name}: {e}")
             return ExtractionResult(
                 product_name=product.name,
@@ -483,7 +485,8 @@ class ProductExtractionAgent:
             )
         finally:
             if extractor:
-                extractor.close()
+                # A browser that raised mid-extraction is not handed to the next product
+                extractor.close(discard=failed)
     
     def _calculate_confidence_score(self, result: Dict[str, Any]) -> float:
         """Calculate confidence score based on extracted data quality"""
@@ -675,7 +678,7 @@ class WorkflowCoordinator:
         
         self.logger.info(f"Processing batch {state['current_product_index']//batch_size + 1}: {len(batch_products)} products")
         
-        # Process batch in parallel
+        # Process batch in parallel (main() keeps one warm browser per worker between batches)
         with ThreadPoolExecutor(max_workers=batch_size) as executor:
             future_to_product = {
                 executor.submit(
@@ -1026,14 +1029,21 @@ def main():
     
     # Import configuration
     try:
-        from gcs_config import USE_GCS, GCS_BUCKET_NAME, GCS_DATA_FOLDER, EXTRACTION_CONFIG, validate_gcs_config
+        from gcs_config import load_gcs_config, validate_gcs_config
     except ImportError:
         print("Error: gcs_config.py not found!")
         print("Please ensure gcs_config.py exists and is properly configured.")
         return
     
+    # Read the latest saved configuration (may have changed since this module was imported)
+    gcs_settings = load_gcs_config()
+    USE_GCS = gcs_settings["USE_GCS"]
+    GCS_BUCKET_NAME = gcs_settings["GCS_BUCKET_NAME"]
+    GCS_DATA_FOLDER = gcs_settings["GCS_DATA_FOLDER"]
+    EXTRACTION_CONFIG = gcs_settings["EXTRACTION_CONFIG"]
+    
     # Validate GCS configuration
-    if not validate_gcs_config():
+    if not validate_gcs_config(gcs_settings):
         print("GCS configuration validation failed. Please fix the issues above.")
         return
     
@@ -1086,9 +1096,10 @@ def main():
     workflow = create_advanced_workflow()
     app = workflow.compile()
     
-    # Run the workflow
+    # Run the workflow, keeping one warm browser per parallel worker between batches
     try:
-        result = app.invoke(initial_state)
+        with FixedSearchExtractor.keep_warm(initial_state["max_parallel_extractions"]):
+            result = app.invoke(initial_state)
         
         # Print enhanced final summary
         print(f"\n{'='*70}")
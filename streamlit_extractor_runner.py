@@ -15,6 +15,9 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 import streamlit as st
 
+# Seconds between background stats refreshes while an extraction is running
+STATS_POLL_INTERVAL = 3
+
 class ExtractionRunner:
     """Handles running the extraction process in the background"""
     
@@ -30,6 +33,8 @@ class ExtractionRunner:
         }
         self.is_running = False
         self.start_time = None
+        self._poll_stop = None
+        self._poll_thread = None
     
     def start_extraction(self) -> bool:
         """Start the extraction process"""
@@ -46,6 +51,13 @@ class ExtractionRunner:
             extraction_thread.daemon = True
             extraction_thread.start()
             
+            # Refresh stats off the Streamlit script thread - one poller per run
+            self._stop_polling()
+            self._poll_stop = threading.Event()
+            self._poll_thread = threading.Thread(target=self._poll_stats, args=(self._poll_stop,))
+            self._poll_thread.daemon = True
+            self._poll_thread.start()
+            
             return True
         except Exception as e:
             self.log_queue.put({
@@ -109,6 +121,25 @@ class ExtractionRunner:
         finally:
             self.is_running = False
     
+    def _poll_stats(self, stop):
+        """Refresh stats from result files in the background until extraction ends or stop is set"""
+        while self.is_running and not stop.is_set():
+            self.update_stats_from_files()
+            stop.wait(STATS_POLL_INTERVAL)
+        # Pick up the final results once the run has finished on its own
+        if not stop.is_set():
+            self.update_stats_from_files()
+    
+    def _stop_polling(self):
+        """Stop the previous run's stats poller and wait for it to exit"""
+        if self._poll_stop:
+            self._poll_stop.set()
+        # A poller only told to stop (see stop_extraction) is still joined here
+        if self._poll_thread and self._poll_thread is not threading.current_thread():
+            self._poll_thread.join()
+        self._poll_stop = None
+        self._poll_thread = None
+    
     def _add_log(self, level: str, message: str):
         """Add a log entry to the queue"""
         self.log_queue.put({
@@ -132,16 +163,40 @@ class ExtractionRunner:
         if self.process:
             self.process.terminate()
         self.is_running = False
+        # Only signal the poller - joining here would block the UI while it reads a large results file
+        if self._poll_stop:
+            self._poll_stop.set()
         self.stats['current_status'] = 'Stopped by user'
         self._add_log('WARNING', 'Extraction stopped by user')
     
+    def _latest_result_files(self):
+        """Return the newest (Excel results, summary JSON) file names in the working directory"""
+        latest = {}
+        with os.scandir('.') as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('product_extraction_results_') and name.endswith('.xlsx'):
+                    kind = 'excel'
+                elif name.startswith('langgraph_advanced_summary_') and name.endswith('.json'):
+                    kind = 'summary'
+                else:
+                    continue
+                mtime = entry.stat().st_mtime
+                if kind not in latest or mtime > latest[kind][0]:
+                    latest[kind] = (mtime, name)
+        return (
+            latest['excel'][1] if 'excel' in latest else None,
+            latest['summary'][1] if 'summary' in latest else None
+        )
+    
     def update_stats_from_files(self):
         """Update statistics by checking result files - handles both local and cloud-first modes"""
         try:
             # Check if we're in cloud-first mode
             try:
-                from gcs_config import USE_GCS, EXTRACTION_CONFIG
-                cloud_first_mode = USE_GCS and EXTRACTION_CONFIG.get("cloud_first_mode", False)
+                from gcs_config import load_gcs_config
+                gcs_settings = load_gcs_config()
+                cloud_first_mode = gcs_settings["USE_GCS"] and gcs_settings["EXTRACTION_CONFIG"].get("cloud_first_mode", False)
             except ImportError:
                 cloud_first_mode = False
             
@@ -151,11 +206,11 @@ class ExtractionRunner:
                 self._add_log('INFO', '🌩️ Cloud-first mode: Stats tracking via GCS (local files not available)')
                 return
             
-            # Local mode: Check for Excel files
-            excel_files = [f for f in os.listdir('.') if f.startswith('product_extraction_results_') and f.endswith('.xlsx')]
-            if excel_files:
-                # Get the most recent file
-                latest_file = max(excel_files, key=os.path.getmtime)
+            # Local mode: find the most recent Excel and summary files in one directory pass
+            latest_file, latest_json = self._latest_result_files()
+            
+            # Check for Excel files
+            if latest_file:
                 try:
                     import pandas as pd
                     df = pd.read_excel(latest_file)
@@ -176,9 +231,7 @@ class ExtractionRunner:
                     self._add_log('WARNING', f'Could not read Excel file: {e}')
             
             # Check for summary JSON files
-            json_files = [f for f in os.listdir('.') if f.startswith('langgraph_advanced_summary_') and f.endswith('.json')]
-            if json_files:
-                latest_json = max(json_files, key=os.path.getmtime)
+            if latest_json:
                 try:
                     with open(latest_json, 'r') as f:
                         summary = json.load(f)